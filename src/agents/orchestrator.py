@@ -3,7 +3,8 @@ Main Orchestrator - Coordinates all agents using A2A Protocol.
 Implements Agent-to-Agent communication.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Deque
+from collections import deque
 from datetime import datetime
 import asyncio
 import time
@@ -27,6 +28,10 @@ logger = AgentLogger("orchestrator")
 tracer = AgentTracer("orchestrator")
 metrics = get_metrics_collector()
 
+# Recent A2A messages kept for inspection; one run sends 5, and a long-lived
+# orchestrator must not accumulate every payload it ever routed
+MESSAGE_HISTORY_LIMIT = 50
+
 
 class A2AMessage:
     """Agent-to-Agent Protocol Message format."""
@@ -77,7 +82,7 @@ class AgentOrchestrator:
         self.memory_bank = get_memory_bank()
         self.evaluator = get_plan_evaluator()
         
-        self.message_queue: List[A2AMessage] = []
+        self.message_queue: Deque[A2AMessage] = deque(maxlen=MESSAGE_HISTORY_LIMIT)
         
         logger.logger.info("orchestrator_initialized", agents=5)
 
@@ -89,7 +94,7 @@ class AgentOrchestrator:
         session_id: Optional[str] = None
     ) -> Dict[str, Any]:
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         if not session_id:
             session_id = f"session_{int(time.time())}"
@@ -181,7 +186,7 @@ class AgentOrchestrator:
                     self.reflection.reflect_and_learn
                 )
 
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                 # FINAL RESULT (UI reads this)
                 result = {
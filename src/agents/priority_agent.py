@@ -40,7 +40,7 @@ class PriorityAgent:
         collected_data: Dict[str, Any],
         session_id: str
     ) -> Dict[str, Any]:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         logger.log_agent_start({
             "session_id": session_id,
@@ -73,7 +73,7 @@ class PriorityAgent:
                     "priority_summary": self._generate_summary(adjusted_tasks)
                 }
 
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 logger.log_agent_complete(
                     result={"task_count": len(adjusted_tasks)},
                     duration_ms=duration_ms
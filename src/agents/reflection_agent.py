@@ -68,7 +68,7 @@ class ReflectionAgent:
         Returns:
             Reflection insights and re-plan recommendation
         """
-        start_time_ms = time.time()
+        start_ns = time.perf_counter_ns()
         
         logger.log_agent_start({
             "session_id": session_id,
@@ -124,7 +124,7 @@ class ReflectionAgent:
                     "agent": self.agent_name
                 }
                 
-                duration_ms = (time.time() - start_time_ms) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 logger.log_agent_complete(
                     result={"replan_needed": replan_decision["needed"]},
@@ -60,7 +60,7 @@ class ReminderAgent:
         Returns:
             Reminders and saved file locations
         """
-        start_time_ms = time.time()
+        start_ns = time.perf_counter_ns()
         
         logger.log_agent_start({
             "session_id": session_id,
@@ -122,7 +122,7 @@ class ReminderAgent:
                     "agent": self.agent_name
                 }
                 
-                duration_ms = (time.time() - start_time_ms) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 logger.log_agent_complete(
                     result={"reminders": len(reminders)},
@@ -10,7 +10,7 @@ import logging
 import sys
 from pathlib import Path
 from datetime import datetime
-from src.utils.config import Config
+from src.utils.config import LOG_LEVEL, PROJECT_ROOT
 
 def setup_logger(name: str = "productivity_agent") -> structlog.BoundLogger:
     """
@@ -28,7 +28,7 @@ def setup_logger(name: str = "productivity_agent") -> structlog.BoundLogger:
     """
     
     # Create logs directory
-    log_dir = Config.PROJECT_ROOT / "logs"
+    log_dir = PROJECT_ROOT / "logs"
     log_dir.mkdir(exist_ok=True)
     
     # Log file with timestamp
@@ -38,7 +38,7 @@ def setup_logger(name: str = "productivity_agent") -> structlog.BoundLogger:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, Config.LOG_LEVEL),
+        level=getattr(logging, LOG_LEVEL),
     )
     
     # Add file handler
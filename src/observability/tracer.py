@@ -69,7 +69,7 @@ class AgentTracer:
                     span.set_attribute(f"custom.{key}", str(value))
             
             # Record start time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             try:
                 yield span
@@ -80,7 +80,7 @@ class AgentTracer:
                 raise
             finally:
                 # Record duration
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 span.set_attribute("duration_ms", duration_ms)
     
     def create_span(self, operation_name: str):
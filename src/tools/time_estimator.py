@@ -5,11 +5,87 @@ Uses historical data to improve estimates.
 FEATURE COVERED: Custom Tools
 """
 
-from typing import Dict, Any, Optional, List
+import functools
+import sys
+from bisect import bisect_left
+from typing import Dict, Any, NamedTuple, Optional, List, Tuple
+
+import numpy as np
+
 from src.observability.logger import setup_logger
 
 logger = setup_logger("time_estimator")
 
+# Duration multipliers by task complexity
+COMPLEXITY_MULTIPLIERS = {
+    "low": 0.7,
+    "medium": 1.0,
+    "high": 1.5
+}
+
+# Task lists at least this long are estimated with NumPy array ops;
+# below it the per-call array overhead outweighs the savings
+VECTORIZE_MIN_TASKS = 64
+
+# Daily workload tiers: up to 4h, 6h, 8h of work, then anything above
+FEASIBILITY_THRESHOLDS = (4, 6, 8)
+FEASIBILITY_LABELS = (
+    "Light workload - easily achievable",
+    "Moderate workload - achievable with focus",
+    "Full workload - requires good time management",
+    "Heavy workload - consider prioritizing or splitting across days"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compute(
+    base_estimate: float,
+    complexity: str,
+    has_history: bool,
+    historical_avg: Optional[int]
+) -> Tuple[float, str]:
+    """
+    Compute (estimated_duration, confidence) for one kind of task.
+    
+    Pure function of its arguments, so results are memoized: tasks
+    sharing a category and complexity are only computed once. Kept at
+    module level so the cache holds no estimator instance.
+    historical_avg is rounded to the minute by callers so near-equal
+    historical averages share a cache entry.
+    """
+    # Adjust for complexity
+    multiplier = COMPLEXITY_MULTIPLIERS.get(complexity, 1.0)
+    
+    estimated_duration = base_estimate * multiplier
+    
+    if historical_avg is not None:
+        # Blend historical average with base estimate
+        estimated_duration = (estimated_duration * 0.4 + historical_avg * 0.6)
+        confidence = "high"
+    elif has_history:
+        confidence = "medium"
+    else:
+        confidence = "low"
+    
+    # Add buffer for uncertainty
+    if confidence == "low":
+        estimated_duration *= 1.2  # Add 20% buffer
+    
+    return estimated_duration, confidence
+
+
+class Estimate(NamedTuple):
+    """
+    Result of estimate_duration.
+    
+    Use ._asdict() where a JSON-serializable mapping is needed.
+    """
+    minutes: int
+    confidence: str
+    category: str
+    complexity: str
+    reasoning: str
+
 
 class TimeEstimatorTool:
     """
@@ -20,8 +96,9 @@ class TimeEstimatorTool:
     """
     
     def __init__(self):
-        # Default estimates by task type (in minutes)
-        self.default_estimates = {
+        # Default estimates by task type (in minutes). Keys are interned so
+        # lookups with interned task categories match on identity.
+        self.default_estimates = {sys.intern(k): v for k, v in {
             "meeting": 30,
             "coding": 90,
             "email": 15,
@@ -33,87 +110,96 @@ class TimeEstimatorTool:
             "testing": 45,
             "deployment": 30,
             "default": 60
+        }.items()}
+        
+        # Array layout of the complexity table for vectorized batch estimates.
+        # Unknown complexities map to the trailing 1.0 multiplier.
+        self._complexity_codes = {
+            name: i for i, name in enumerate(COMPLEXITY_MULTIPLIERS)
         }
+        self._cmult = np.array(
+            list(COMPLEXITY_MULTIPLIERS.values()) + [1.0],
+            dtype=np.float64
+        )
         logger.info("time_estimator_tool_initialized")
     
     def estimate_duration(
         self,
         task: Dict[str, Any],
         historical_data: Optional[List[Dict]] = None
-    ) -> Dict[str, Any]:
+    ) -> Estimate:
         """
         Estimate how long a task will take.
         
         Custom Tool Specification:
         - Tool Name: estimate_duration
         - Inputs: task details, historical data
-        - Output: estimated duration with confidence
+        - Output: Estimate (minutes, confidence, category, complexity,
+          reasoning)
         
         Usage by agent:
             estimate = time_estimator.estimate_duration(task, history)
         """
-        logger.info("estimating_duration", task_name=task.get("name"))
-        
-        category = task.get("category", "").lower()
-        complexity = task.get("complexity", "medium")  # low, medium, high
-        
-        # Start with base estimate
-        base_estimate = self.default_estimates.get(
-            category,
-            self.default_estimates["default"]
-        )
-        
-        # Adjust for complexity
-        complexity_multipliers = {
-            "low": 0.7,
-            "medium": 1.0,
-            "high": 1.5
-        }
-        multiplier = complexity_multipliers.get(complexity, 1.0)
-        
-        estimated_duration = base_estimate * multiplier
+        category, _ = self._task_key(task)
         
         # If we have historical data for similar tasks, use it
+        category_means = None
         if historical_data:
-            similar_tasks = [
-                t for t in historical_data
-                if t.get("category") == category
-            ]
+            category_means = {}
+            # One pass, accumulating only matching tasks
+            sum_actual = 0
+            count = 0
+            for t in historical_data:
+                if t.get("category") == category:
+                    sum_actual += t.get("actual_duration", 0)
+                    count += 1
             
-            if similar_tasks:
-                historical_avg = sum(
-                    t.get("actual_duration", 0) for t in similar_tasks
-                ) / len(similar_tasks)
-                
-                # Blend historical average with base estimate
-                estimated_duration = (estimated_duration * 0.4 + historical_avg * 0.6)
-                confidence = "high"
-            else:
-                confidence = "medium"
-        else:
-            confidence = "low"
+            if count:
+                category_means[category] = round(sum_actual / count)
         
-        # Add buffer for uncertainty
-        if confidence == "low":
-            estimated_duration *= 1.2  # Add 20% buffer
+        return self.estimate_duration_fast(task, category_means)
+    
+    def estimate_duration_fast(
+        self,
+        task: Dict[str, Any],
+        category_means: Optional[Dict[str, float]] = None
+    ) -> Estimate:
+        """
+        Estimate a task's duration from precomputed historical averages.
         
-        result = {
-            "estimated_duration_minutes": round(estimated_duration),
-            "confidence": confidence,
-            "base_category": category,
-            "complexity": complexity,
-            "reasoning": self._generate_reasoning(
+        Same output as estimate_duration, but takes the per-category
+        averages built by _category_means instead of raw historical data,
+        so estimating many tasks costs one pass over the history.
+        None means no historical data is available.
+        """
+        logger.info("estimating_duration", task_name=task.get("name"))
+        
+        category, complexity = self._task_key(task)
+        estimated_duration, confidence = self._lookup(
+            category,
+            complexity,
+            category_means
+        )
+        # Estimates are never negative, so this rounds half up
+        rounded = int(estimated_duration + 0.5)
+        
+        result = Estimate(
+            minutes=rounded,
+            confidence=confidence,
+            category=category,
+            complexity=complexity,
+            reasoning=self._generate_reasoning(
                 category,
                 complexity,
-                estimated_duration,
+                rounded,
                 confidence
             )
-        }
+        )
         
         logger.info(
             "duration_estimated",
             task_name=task.get("name"),
-            estimate=result["estimated_duration_minutes"],
+            estimate=result.minutes,
             confidence=confidence
         )
         
@@ -121,32 +207,43 @@ class TimeEstimatorTool:
     
     def estimate_total_workload(
         self,
-        tasks: List[Dict[str, Any]]
+        tasks: List[Dict[str, Any]],
+        historical_data: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Estimate total time needed for a list of tasks.
         
         Custom Tool Specification:
         - Tool Name: estimate_total_workload
-        - Input: list of tasks
+        - Input: list of tasks, optional historical data
         - Output: total estimated time and breakdown
         
         Useful for planning daily schedules.
         """
         logger.info("estimating_total_workload", task_count=len(tasks))
         
-        total_minutes = 0
-        task_estimates = []
+        # Aggregate history once instead of re-filtering it for every task
+        category_means = (
+            self._category_means(historical_data) if historical_data else None
+        )
+        
+        if len(tasks) >= VECTORIZE_MIN_TASKS:
+            minutes_per_task = self._estimate_minutes_batch(tasks, category_means)
+        else:
+            minutes_per_task = [
+                self._estimate_minutes_only(task, category_means)
+                for task in tasks
+            ]
         
-        for task in tasks:
-            estimate = self.estimate_duration(task)
-            total_minutes += estimate["estimated_duration_minutes"]
-            
-            task_estimates.append({
+        total_minutes = sum(minutes_per_task)
+        task_estimates = [
+            {
                 "task_name": task.get("name"),
-                "estimated_minutes": estimate["estimated_duration_minutes"],
+                "estimated_minutes": estimated_minutes,
                 "category": task.get("category")
-            })
+            }
+            for task, estimated_minutes in zip(tasks, minutes_per_task)
+        ]
         
         # Convert to hours and minutes
         hours = total_minutes // 60
@@ -179,52 +276,176 @@ class TimeEstimatorTool:
         
         Uses the Pomodoro technique and ergonomic guidelines.
         """
-        breaks = []
         work_blocks = total_work_minutes // 90  # 90-minute work blocks
         
-        for i in range(work_blocks):
-            break_time = (i + 1) * 90
-            break_duration = 15 if i % 2 == 0 else 5  # Alternate break lengths
-            
-            breaks.append({
+        idx = np.arange(work_blocks)
+        break_times = (idx + 1) * 90
+        break_durations = np.where(idx % 2 == 0, 15, 5)  # Alternate break lengths
+        
+        return [
+            {
                 "after_minutes": break_time,
                 "break_duration_minutes": break_duration,
                 "break_type": "long" if break_duration == 15 else "short"
-            })
+            }
+            for break_time, break_duration in zip(
+                break_times.tolist(),
+                break_durations.tolist()
+            )
+        ]
+    
+    def _task_key(self, task: Dict[str, Any]) -> Tuple[str, str]:
+        """Extract the (category, complexity) pair an estimate depends on"""
+        raw = task.get("category") or ""
+        # Skip the lower() copy when already lowercase; intern so repeated
+        # categories hit the dict identity fast path
+        category = sys.intern(raw if raw.islower() else raw.lower())
+        complexity = task.get("complexity", "medium")  # low, medium, high
+        return category, complexity
+    
+    def _category_means(
+        self,
+        historical_data: List[Dict]
+    ) -> Dict[str, float]:
+        """
+        Average actual duration per category, rounded to the minute.
+        
+        Built in a single pass over the historical data.
+        """
+        totals: Dict[str, List[float]] = {}
+        for t in historical_data:
+            agg = totals.setdefault(t.get("category"), [0, 0])
+            agg[0] += 1
+            agg[1] += t.get("actual_duration", 0)
+        
+        return {
+            category: round(sum_actual / count)
+            for category, (count, sum_actual) in totals.items()
+        }
+    
+    def _estimate_minutes_only(
+        self,
+        task: Dict[str, Any],
+        category_means: Optional[Dict[str, float]] = None
+    ) -> int:
+        """
+        Rounded estimate in minutes for one task.
+        
+        Fast path for callers that only need the number: no result dict,
+        reasoning text or per-task logging.
+        """
+        category, complexity = self._task_key(task)
+        estimated_duration, _ = self._lookup(category, complexity, category_means)
+        return int(estimated_duration + 0.5)
+    
+    def _estimate_minutes_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        category_means: Optional[Dict[str, float]]
+    ) -> List[int]:
+        """
+        Vectorized equivalent of _lookup for a whole list of tasks.
         
-        return breaks
+        Tasks are mapped to category/complexity codes in one pass and the
+        arithmetic runs as NumPy array expressions. Operations are applied
+        in the same order as _compute, so results match it exactly.
+        """
+        # Category codes are rebuilt per call (about a dozen entries) so edits
+        # to default_estimates apply here exactly as in the scalar path
+        cat_codes = {name: i for i, name in enumerate(self.default_estimates)}
+        base_arr = np.fromiter(
+            self.default_estimates.values(),
+            dtype=np.float64,
+            count=len(cat_codes)
+        )
+        default_code = cat_codes["default"]
+        unknown_complexity = len(self._complexity_codes)
+        
+        keys = [self._task_key(task) for task in tasks]
+        cat_idx = np.fromiter(
+            (cat_codes.get(c, default_code) for c, _ in keys),
+            dtype=np.intp,
+            count=len(keys)
+        )
+        cpl_idx = np.fromiter(
+            (self._complexity_codes.get(x, unknown_complexity) for _, x in keys),
+            dtype=np.intp,
+            count=len(keys)
+        )
+        
+        est = base_arr[cat_idx] * self._cmult[cpl_idx]
+        
+        if category_means is None:
+            est = est * 1.2  # Add 20% buffer
+        else:
+            hist = np.fromiter(
+                (category_means.get(c, np.nan) for c, _ in keys),
+                dtype=np.float64,
+                count=len(keys)
+            )
+            has_hist = ~np.isnan(hist)
+            est = np.where(has_hist, est * 0.4 + hist * 0.6, est)
+        
+        # Same half-up rounding as the scalar int(x + 0.5)
+        return np.floor(est + 0.5).astype(np.int64).tolist()
+    
+    def _lookup(
+        self,
+        category: str,
+        complexity: str,
+        category_means: Optional[Dict[str, float]]
+    ) -> Tuple[float, str]:
+        """Resolve (estimated_duration, confidence) via the memoized _compute"""
+        # Base estimate is read per call so edits to default_estimates apply
+        base_estimate = self.default_estimates.get(
+            category,
+            self.default_estimates["default"]
+        )
+        if category_means is None:
+            return _compute(base_estimate, complexity, False, None)
+        return _compute(
+            base_estimate,
+            complexity,
+            True,
+            category_means.get(category)
+        )
     
     def _generate_reasoning(
         self,
         category: str,
         complexity: str,
-        estimate: float,
+        estimate: int,
         confidence: str
     ) -> str:
-        """Generate human-readable reasoning for the estimate"""
+        """Generate human-readable reasoning for an already rounded estimate"""
+        prefix = self._reasoning_prefix(category, complexity, confidence)
+        return f"{prefix}{estimate} minutes."
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _reasoning_prefix(
+        category: str,
+        complexity: str,
+        confidence: str
+    ) -> str:
+        """Reasoning text up to the minute count; shared by similar tasks"""
         base = f"Based on '{category}' category with '{complexity}' complexity"
         
         if confidence == "high":
             historical = ", and similar historical tasks"
-            return f"{base}{historical}, estimated {round(estimate)} minutes."
+            return f"{base}{historical}, estimated "
         elif confidence == "medium":
-            return f"{base}, estimated {round(estimate)} minutes."
+            return f"{base}, estimated "
         else:
             buffer = " (with 20% buffer for uncertainty)"
-            return f"{base}{buffer}, estimated {round(estimate)} minutes."
+            return f"{base}{buffer}, estimated "
     
     def _assess_feasibility(self, total_minutes: int) -> str:
         """Assess if workload is feasible for one day"""
         hours = total_minutes / 60
         
-        if hours <= 4:
-            return "Light workload - easily achievable"
-        elif hours <= 6:
-            return "Moderate workload - achievable with focus"
-        elif hours <= 8:
-            return "Full workload - requires good time management"
-        else:
-            return "Heavy workload - consider prioritizing or splitting across days"
+        # bisect_left keeps the tier boundaries inclusive (exactly 4h is light)
+        return FEASIBILITY_LABELS[bisect_left(FEASIBILITY_THRESHOLDS, hours)]
 
 
 # Global time estimator instance
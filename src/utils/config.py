@@ -5,54 +5,92 @@ Loads settings from environment variables and provides defaults.
 
 import os
 from pathlib import Path
+from typing import Final
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Settings are resolved once at import and exposed as module-level
+# constants; hot paths can import them directly instead of going
+# through Config attribute lookups.
+
+# API Configuration
+GOOGLE_API_KEY: Final[str] = os.getenv("GOOGLE_API_KEY", "")
+GEMINI_MODEL: Final[str] = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
+
+# Project paths
+PROJECT_ROOT: Final[Path] = Path(__file__).parent.parent.parent
+DATA_DIR: Final[Path] = PROJECT_ROOT / "data"
+OUTPUTS_DIR: Final[Path] = DATA_DIR / "outputs"
+REPORTS_DIR: Final[Path] = OUTPUTS_DIR / "reports"
+
+# Memory configuration
+MEMORY_BANK_PATH: Final[str] = os.getenv(
+    "MEMORY_BANK_PATH", 
+    str(DATA_DIR / "memory_bank.json")
+)
+SESSION_TIMEOUT: Final[int] = int(os.getenv("SESSION_TIMEOUT", "3600"))
+
+# Observability
+LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
+ENABLE_TRACING: Final[bool] = os.getenv("ENABLE_TRACING", "true").lower() == "true"
+ENABLE_METRICS: Final[bool] = os.getenv("ENABLE_METRICS", "true").lower() == "true"
+
+# Agent configuration
+MAX_RETRIES: Final[int] = int(os.getenv("MAX_RETRIES", "3"))
+AGENT_TIMEOUT: Final[int] = int(os.getenv("AGENT_TIMEOUT", "60"))
+
+
 class Config:
     """Central configuration class for all settings"""
     
+    # Namespace only, never instantiated
+    __slots__ = ()
+    
     # API Configuration
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
-    GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
+    GOOGLE_API_KEY = GOOGLE_API_KEY
+    GEMINI_MODEL = GEMINI_MODEL
     
     # Project paths
-    PROJECT_ROOT = Path(__file__).parent.parent.parent
-    DATA_DIR = PROJECT_ROOT / "data"
-    OUTPUTS_DIR = DATA_DIR / "outputs"
-    REPORTS_DIR = OUTPUTS_DIR / "reports"
+    PROJECT_ROOT = PROJECT_ROOT
+    DATA_DIR = DATA_DIR
+    OUTPUTS_DIR = OUTPUTS_DIR
+    REPORTS_DIR = REPORTS_DIR
     
     # Memory configuration
-    MEMORY_BANK_PATH = os.getenv(
-        "MEMORY_BANK_PATH", 
-        str(DATA_DIR / "memory_bank.json")
-    )
-    SESSION_TIMEOUT = int(os.getenv("SESSION_TIMEOUT", "3600"))
+    MEMORY_BANK_PATH = MEMORY_BANK_PATH
+    SESSION_TIMEOUT = SESSION_TIMEOUT
     
     # Observability
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    ENABLE_TRACING = os.getenv("ENABLE_TRACING", "true").lower() == "true"
-    ENABLE_METRICS = os.getenv("ENABLE_METRICS", "true").lower() == "true"
+    LOG_LEVEL = LOG_LEVEL
+    ENABLE_TRACING = ENABLE_TRACING
+    ENABLE_METRICS = ENABLE_METRICS
     
     # Agent configuration
-    MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-    AGENT_TIMEOUT = int(os.getenv("AGENT_TIMEOUT", "60"))
+    MAX_RETRIES = MAX_RETRIES
+    AGENT_TIMEOUT = AGENT_TIMEOUT
+    
+    # Set once validate() has succeeded so repeat calls skip the mkdirs
+    _validated = False
     
     @classmethod
     def validate(cls):
         """Validate that required configuration is present"""
+        if cls._validated:
+            return True
+        
         if not cls.GOOGLE_API_KEY:
             raise ValueError(
                 "GOOGLE_API_KEY not found. Please set it in .env file"
             )
         
         # Create necessary directories
-        cls.DATA_DIR.mkdir(exist_ok=True)
-        cls.OUTPUTS_DIR.mkdir(exist_ok=True)
-        cls.REPORTS_DIR.mkdir(exist_ok=True)
+        for directory in (cls.DATA_DIR, cls.OUTPUTS_DIR, cls.REPORTS_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
         
+        cls._validated = True
         return True
 
 # Validate configuration on import
-Config.validate()
\ No newline at end of file
+Config.validate()
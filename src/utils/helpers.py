@@ -4,14 +4,58 @@ Provides common operations like date parsing, ID generation, etc.
 """
 
 import json
-import uuid
+import os
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 import re
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: Any, indent: bool = True) -> bytes:
+        # Pass datetimes through to default=str so output matches stdlib json
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+else:
+    _loads = json.loads
+
+    def _dumps(data: Any, indent: bool = True) -> bytes:
+        return json.dumps(data, indent=2 if indent else None, default=str).encode("utf-8")
+
+# Number in relative dates such as "in 3 days"
+_REL_NUM_RE = re.compile(r'(\d+)')
+
+# Slash-separated dates are ambiguous, so both orders are tried (US first)
+_SLASH_FORMATS = ("%m/%d/%Y", "%d/%m/%Y")
+
+# A bulleted line; captures the item text without bullet or surrounding
+# whitespace. [^\S\n] is whitespace that never crosses a line break.
+_BULLET_RE = re.compile(
+    r'^[^\S\n]*[-*•□☐][^\S\n]*(\S.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# Flags for save_json; O_BINARY stops newline translation on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Deadline urgency boost: <=1 day critical, <=3 urgent, <=7 soon
+_DEADLINE_THRESHOLDS = (1, 3, 7)
+_DEADLINE_FACTORS = (0.5, 0.3, 0.1, 0.0)
+
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with optional prefix"""
-    unique_id = str(uuid.uuid4())[:8]
+    # 4 random bytes -> 8 hex chars, same shape as a truncated uuid4
+    unique_id = os.urandom(4).hex()
     return f"{prefix}_{unique_id}" if prefix else unique_id
 
 def parse_date(date_str: str) -> Optional[datetime]:
@@ -28,13 +72,29 @@ def parse_date(date_str: str) -> Optional[datetime]:
         return datetime.now() + timedelta(days=1)
     elif "in" in date_str and "day" in date_str:
         # Extract number from "in 3 days"
-        match = re.search(r'(\d+)', date_str)
+        match = _REL_NUM_RE.search(date_str)
         if match:
             days = int(match.group(1))
             return datetime.now() + timedelta(days=days)
     
-    # Try parsing absolute date formats
-    formats = ["%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%Y"]
+    # Pick the absolute format from the separator layout rather than
+    # trying every format and paying for a ValueError on each miss
+    dash = date_str.find('-')
+    if dash == 4:
+        if len(date_str) == 10:
+            # Zero-padded ISO date: use the C-level ISO parser
+            try:
+                return datetime.fromisoformat(date_str)
+            except ValueError:
+                return None
+        formats = ("%Y-%m-%d",)
+    elif dash != -1:
+        formats = ("%d-%m-%Y",)
+    elif '/' in date_str:
+        formats = _SLASH_FORMATS
+    else:
+        return None
+    
     for fmt in formats:
         try:
             return datetime.strptime(date_str, fmt)
@@ -62,31 +122,55 @@ def calculate_priority_score(
     # Deadline urgency boost
     deadline_factor = 0
     if deadline_days is not None:
-        if deadline_days <= 1:
-            deadline_factor = 0.5  # Critical
-        elif deadline_days <= 3:
-            deadline_factor = 0.3  # Urgent
-        elif deadline_days <= 7:
-            deadline_factor = 0.1  # Soon
+        # bisect_left gives the first threshold >= deadline_days
+        deadline_factor = _DEADLINE_FACTORS[
+            bisect_left(_DEADLINE_THRESHOLDS, deadline_days)
+        ]
     
     total_score = base_score + effort_factor + deadline_factor
     return round(total_score, 2)
 
+def calculate_priority_scores_batch(
+    urgency: Sequence[int],
+    importance: Sequence[int],
+    effort: Sequence[int],
+    deadline_days: Sequence[Optional[int]]
+) -> np.ndarray:
+    """
+    Vectorized calculate_priority_score for ranking many tasks at once.
+    Takes equal-length sequences (None or NaN = no deadline) and returns
+    a float array of scores.
+    """
+    u = np.asarray(urgency, dtype=np.float64)
+    i = np.asarray(importance, dtype=np.float64)
+    e = np.asarray(effort, dtype=np.float64)
+    d = np.array(
+        [np.nan if x is None else x for x in deadline_days],
+        dtype=np.float64
+    )
+    
+    # NaN compares False everywhere, so missing deadlines fall through to 0
+    deadline_factor = np.select(
+        [d <= 1, d <= 3, d <= 7],
+        [0.5, 0.3, 0.1],
+        default=0.0
+    )
+    
+    total_score = (u * 0.4) + (i * 0.4) + (6 - e) * 0.1 + deadline_factor
+    return np.round(total_score, 2)
+
 def format_duration(minutes: int) -> str:
     """Convert minutes to human-readable duration"""
     if minutes < 60:
         return f"{minutes}m"
-    hours = minutes // 60
-    remaining_mins = minutes % 60
-    if remaining_mins == 0:
-        return f"{hours}h"
-    return f"{hours}h {remaining_mins}m"
+    hours, remaining_mins = divmod(minutes, 60)
+    return f"{hours}h {remaining_mins}m" if remaining_mins else f"{hours}h"
 
 def load_json(filepath: str) -> Dict[str, Any]:
     """Safely load JSON file"""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return _loads(f.read())
     except FileNotFoundError:
         return {}
     except json.JSONDecodeError:
@@ -95,8 +179,14 @@ def load_json(filepath: str) -> Dict[str, Any]:
 def save_json(data: Dict[str, Any], filepath: str) -> bool:
     """Safely save JSON file"""
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        payload = memoryview(_dumps(data))
+        # Write the whole payload straight to the fd, no buffered file object
+        fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
         return True
     except Exception as e:
         print(f"Error saving JSON: {e}")
@@ -104,13 +194,4 @@ def save_json(data: Dict[str, Any], filepath: str) -> bool:
 
 def extract_action_items(text: str) -> List[str]:
     """Extract action items from text (lines starting with -, *, or •)"""
-    lines = text.split('\n')
-    actions = []
-    for line in lines:
-        line = line.strip()
-        if line.startswith(('-', '*', '•', '□', '☐')):
-            # Remove the bullet point
-            action = re.sub(r'^[-*•□☐]\s*', '', line)
-            if action:
-                actions.append(action)
-    return actions
\ No newline at end of file
+    return [m.group(1) for m in _BULLET_RE.finditer(text)]
\ No newline at end of file
@@ -0,0 +1,112 @@
+import gc
+import weakref
+from datetime import datetime
+
+from src.tools.time_estimator import TimeEstimatorTool
+from src.utils.helpers import (
+    calculate_priority_score,
+    calculate_priority_scores_batch,
+    parse_date,
+)
+
+
+def test_estimate_total_workload_matches_single_estimates():
+    est = TimeEstimatorTool()
+    tasks = [
+        {"name": "a", "category": "coding", "complexity": "high"},
+        {"name": "b", "category": "Coding", "complexity": "high"},
+        {"name": "c", "category": "email", "complexity": "low"},
+        {"name": "d", "category": "unknown"},
+    ]
+    workload = est.estimate_total_workload(tasks)
+    singles = [est.estimate_duration(t).minutes for t in tasks]
+    assert [t["estimated_minutes"] for t in workload["task_estimates"]] == singles
+    assert workload["total_minutes"] == sum(singles)
+
+
+def test_estimate_total_workload_uses_historical_averages():
+    est = TimeEstimatorTool()
+    history = [
+        {"category": "coding", "actual_duration": 100},
+        {"category": "coding", "actual_duration": 120},
+        {"category": "email", "actual_duration": 10},
+    ]
+    tasks = [
+        {"name": "a", "category": "coding"},
+        {"name": "b", "category": "meeting"},
+    ]
+    workload = est.estimate_total_workload(tasks, history)
+    singles = [
+        est.estimate_duration(t, history).minutes
+        for t in tasks
+    ]
+    assert [t["estimated_minutes"] for t in workload["task_estimates"]] == singles
+    # 90 * 0.4 + 110 * 0.6
+    assert singles[0] == 102
+
+
+def test_vectorized_workload_matches_scalar_path():
+    est = TimeEstimatorTool()
+    categories = ["coding", "email", "meeting", "misc", "Research"]
+    complexities = ["low", "medium", "high", "weird"]
+    tasks = [
+        {"name": f"t{i}", "category": categories[i % 5],
+         "complexity": complexities[i % 4]}
+        for i in range(100)
+    ]
+    history = [
+        {"category": "email", "actual_duration": 12},
+        {"category": "coding", "actual_duration": 75},
+    ]
+    for hist in (None, history):
+        workload = est.estimate_total_workload(tasks, hist)
+        singles = [
+            est.estimate_duration(t, hist).minutes
+            for t in tasks
+        ]
+        assert [t["estimated_minutes"] for t in workload["task_estimates"]] == singles
+        assert workload["total_minutes"] == sum(singles)
+
+
+def test_vectorized_workload_follows_edited_estimates():
+    est = TimeEstimatorTool()
+    est.default_estimates["email"] = 20
+    est.default_estimates["design"] = 10
+    tasks = [
+        {"name": f"t{i}", "category": ("email", "design")[i % 2]}
+        for i in range(64)
+    ]
+    workload = est.estimate_total_workload(tasks)
+    singles = [est.estimate_duration(t).minutes for t in tasks]
+    assert [t["estimated_minutes"] for t in workload["task_estimates"]] == singles
+    assert singles[:2] == [24, 12]
+
+
+def test_estimate_cache_does_not_pin_instances():
+    est = TimeEstimatorTool()
+    assert est.estimate_duration({"category": "email"}).minutes == 18
+    # per-instance tables are honoured, not whatever another instance cached
+    est.default_estimates["email"] = 20
+    assert est.estimate_duration({"category": "email"}).minutes == 24
+    ref = weakref.ref(est)
+    del est
+    gc.collect()
+    assert ref() is None
+
+
+def test_priority_scores_batch_matches_scalar():
+    rows = [
+        (5, 4, 1, 0), (3, 3, 2, 2), (1, 2, 5, None),
+        (3, 2, 3, 5), (5, 5, 4, 10), (2, 3, 2, 7),
+    ]
+    batch = calculate_priority_scores_batch(*zip(*rows))
+    assert batch.tolist() == [calculate_priority_score(*r) for r in rows]
+
+
+def test_parse_date_absolute_formats():
+    assert parse_date("2025-11-20") == datetime(2025, 11, 20)
+    assert parse_date("2025-1-5") == datetime(2025, 1, 5)
+    assert parse_date("20-11-2025") == datetime(2025, 11, 20)
+    assert parse_date("11/20/2025") == datetime(2025, 11, 20)
+    assert parse_date("20/11/2025") == datetime(2025, 11, 20)
+    assert parse_date("someday") is None
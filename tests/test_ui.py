@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ui import gradio_app
+from ui.gradio_app import (
+    _load_all_reminders,
+    _parse_manual_reminder,
+    _reminders_for_schedule,
+    _save_new_reminders,
+)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def no_reminder_checker():
+    # Importing the app starts the checker thread; keep it off the state
+    # these tests patch
+    gradio_app.stop_checker()
+    gradio_app.checker_thread.join(timeout=5)
+
+
+def _today_at(hour, minute):
+    today = datetime.now(timezone.utc).date()
+    return datetime(today.year, today.month, today.day, hour, minute, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("text, message, expected", [
+    ("Call mom at 4:00 pm", "Call mom", _today_at(16, 0)),
+    ("Standup AT 12:30PM", "Standup", _today_at(12, 30)),
+    ("Lunch at 12:05 am", "Lunch", _today_at(0, 5)),
+    ("Pay rent at 2025-01-02T10:00:00Z", "Pay rent at 2025-01-02T10:00:00Z",
+     datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)),
+])
+def test_parse_manual_reminder_times(text, message, expected):
+    msg, when = _parse_manual_reminder(text)
+    assert msg == message
+    assert datetime.fromisoformat(when) == expected
+
+
+@pytest.mark.parametrize("text", ["meet at cafe", "buy milk", "call at 25:99 pm"])
+def test_parse_manual_reminder_falls_back_to_now(text):
+    before = datetime.now(timezone.utc)
+    msg, when = _parse_manual_reminder(text)
+    assert msg == text
+    assert before <= datetime.fromisoformat(when) <= datetime.now(timezone.utc)
+
+
+def test_resubmitted_schedule_does_not_duplicate_reminders(tmp_path, monkeypatch):
+    monkeypatch.setattr(gradio_app, "OUTPUTS_DIR", str(tmp_path))
+    monkeypatch.setattr(gradio_app, "_REMINDERS_CACHE", {})
+    monkeypatch.setattr(gradio_app, "_FRESH_REMINDERS", [])
+    result = {"outputs": {"planned": {"scheduled_tasks": [
+        {"type": "task", "name": "Write report", "priority": "High",
+         "start_time": "2025-01-02T10:00:00+00:00",
+         "due_date": "2025-01-03T17:00:00+00:00"},
+        {"type": "break", "start_time": "2025-01-02T11:00:00+00:00"},
+    ]}}}
+
+    first = _save_new_reminders(_reminders_for_schedule(result))
+    assert len(first) == 3  # start, high-priority early alert, deadline
+    assert _save_new_reminders(_reminders_for_schedule(result)) == []
+
+    on_disk = _load_all_reminders()
+    assert sorted(r["id"] for r in on_disk) == sorted(r["id"] for r in first)
+    assert len(list(tmp_path.glob("reminders_session_*.json"))) == 1
+
+
+def test_history_journal_round_trip(tmp_path, monkeypatch):
+    index = tmp_path / "history_index.json"
+    log = tmp_path / "history_index.json.log"
+    monkeypatch.setattr(gradio_app, "OUTPUTS_DIR", str(tmp_path))
+    monkeypatch.setattr(gradio_app, "HISTORY_INDEX", str(index))
+    monkeypatch.setattr(gradio_app, "HISTORY_LOG", str(log))
+    monkeypatch.setattr(gradio_app, "HISTORY_LOG_COMPACT_LINES", 3)
+    monkeypatch.setattr(gradio_app, "_HISTORY_INDEX", [])
+    monkeypatch.setattr(gradio_app, "_history_log_lines", 0)
+    monkeypatch.setattr(gradio_app, "_HISTORY_STAMP", (None, None))
+    monkeypatch.setattr(gradio_app, "_HISTORY_SNAPSHOT", None)
+
+    def save(n):
+        return gradio_app._save_history_entry(
+            f"<p>{n}</p>",
+            {"title": f"s{n}", "created_at": f"2025-01-0{n}T09:00:00+00:00"},
+        )
+
+    def loaded_titles():
+        return [e["title"] for e in gradio_app._read_history_index_file()]
+
+    # appends only go to the journal
+    save(1)
+    save(2)
+    assert not index.exists()
+    assert len(log.read_bytes().splitlines()) == 2
+    assert loaded_titles() == ["s2", "s1"]
+
+    # the third append compacts the journal into the index
+    save(3)
+    assert log.read_bytes() == b""
+    assert [e["title"] for e in gradio_app._json_loads(index.read_bytes())] == ["s3", "s2", "s1"]
+
+    save(4)
+    assert loaded_titles() == ["s4", "s3", "s2", "s1"]
+    assert [e["title"] for e in gradio_app._load_history_index()] == ["s4", "s3", "s2", "s1"]
+
+    # crash after the compacted index was written but before the journal was
+    # truncated: entry 4 is in both files and must only show up once
+    index.write_bytes(gradio_app._json_dumps(gradio_app._HISTORY_INDEX))
+    assert loaded_titles() == ["s4", "s3", "s2", "s1"]
+    assert gradio_app._read_history_file(save(5)["id"]) == "<p>5</p>"
+
+
+def test_orchestrator_cache_key_changes_with_the_local_day(monkeypatch):
+    class FixedDatetime(datetime):
+        day_offset = 0
+
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 1, 1, 23, 59, tzinfo=tz) + timedelta(days=cls.day_offset)
+
+    monkeypatch.setattr(gradio_app, "datetime", FixedDatetime)
+    today = gradio_app._orch_cache_key("write report")
+    assert gradio_app._orch_cache_key("write report") == today
+    FixedDatetime.day_offset = 1
+    assert gradio_app._orch_cache_key("write report") != today
@@ -1,30 +1,78 @@
 import gradio as gr
 import asyncio
+import copy
+import functools
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html import escape as _escape
+import heapq
+import itertools
 import os
-import json
 import threading
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple, List, Dict, Any
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Tuple, List, Dict, Any, Iterator
 import re
 
+import jinja2
 import tzlocal  # pip install tzlocal
 
 from src.agents.orchestrator import create_orchestrator
+# Same JSON encoding as the memory bank and other data files
+from src.utils.helpers import _dumps as _json_dumps, _loads as _json_loads
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 OUTPUTS_DIR = os.path.join(ROOT_DIR, "data", "outputs")
 HISTORY_INDEX = os.path.join(OUTPUTS_DIR, "history_index.json")
+# Append-only JSON-lines journal of entries saved since the last compaction
+# into HISTORY_INDEX
+HISTORY_LOG = HISTORY_INDEX + ".log"
+HISTORY_LOG_COMPACT_LINES = 100
+HISTORY_MAX_ENTRIES = 500
 REMINDERS_FIRED = os.path.join(OUTPUTS_DIR, "reminders_fired.json")
+# Append-only log of IDs fired since the last compaction into REMINDERS_FIRED
+REMINDERS_FIRED_LOG = REMINDERS_FIRED + ".log"
+FIRED_LOG_COMPACT_LINES = 10_000
+# Fired IDs (and reminders scheduled) older than this are forgotten
+FIRED_RETENTION_SECONDS = 7 * 86400
 
 os.makedirs(OUTPUTS_DIR, exist_ok=True)
 
+# Notifications fired while no browser tab is listening; handed to the next
+# stream that connects
 NOTIFICATION_BUFFER: List[Dict[str, Any]] = []
 NOTIFICATION_LOCK = threading.Lock()
-STOP_THREAD = False
+_STOP_EVENT = threading.Event()
+# One _NotifySubscriber per connected notification stream
+_NOTIFY_SUBSCRIBERS: set = set()
+# How long a toast stays up before the area is cleared
+TOAST_SECONDS = 5
+# "<message> at H:MM AM" in the manual reminder box
+_AT_TIME_RE = re.compile(r"^(.*?)\s+at\s+(\d{1,2}:\d{2})\s*([AaPp][Mm])\s*$", re.IGNORECASE)
+_EMPTY_TOAST_HTML = "<div class='toast-wrap' id='toast_wrap'></div>"
 
 LOCAL_TZ = tzlocal.get_localzone()
 
+# Orchestrator is built once and reused across submissions
+_ORCH_SINGLETON = None
+_ORCH_LOCK = threading.Lock()
+
+# Persistent event loop owned by a background thread; avoids creating and
+# tearing down a loop with asyncio.run() on every request. The agent
+# coroutines never yield, so submissions run one at a time on this thread;
+# the shared orchestrator's session state relies on that serialization.
+_LOOP = asyncio.new_event_loop()
+_loop_thread = threading.Thread(target=_LOOP.run_forever, daemon=True)
+_loop_thread.start()
+
+
+def _in_thread(fn, *args):
+    """Run blocking fn(*args) in the default executor (asyncio.to_thread needs 3.9)."""
+    return asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
 
 def _read_uploaded_file(uploaded) -> Tuple[str, Optional[str]]:
     if not uploaded:
@@ -33,8 +81,7 @@ def _read_uploaded_file(uploaded) -> Tuple[str, Optional[str]]:
         path = uploaded.get("name") or uploaded.get("tmp_path") or uploaded.get("file_name")
         if path and os.path.exists(path):
             try:
-                with open(path, "rb") as f:
-                    return f.read().decode("utf-8", errors="replace"), path
+                return Path(path).read_text("utf-8", errors="replace"), path
             except Exception:
                 pass
         content = uploaded.get("data") or uploaded.get("content") or str(uploaded)
@@ -51,8 +98,7 @@ def _read_uploaded_file(uploaded) -> Tuple[str, Optional[str]]:
     if isinstance(uploaded, str):
         if os.path.exists(uploaded):
             try:
-                with open(uploaded, "rb") as f:
-                    return f.read().decode("utf-8", errors="replace"), uploaded
+                return Path(uploaded).read_text("utf-8", errors="replace"), uploaded
             except Exception:
                 pass
         return uploaded, None
@@ -62,6 +108,20 @@ def _read_uploaded_file(uploaded) -> Tuple[str, Optional[str]]:
 def _parse_iso_to_local(ts: str) -> Optional[datetime]:
     if not ts:
         return None
+    return _parse_iso_to_local_cached(ts)
+
+
+def _parse_iso_to_utc(ts: str) -> Optional[datetime]:
+    """Parse to an aware UTC datetime; never touches LOCAL_TZ."""
+    if not ts:
+        return None
+    return _parse_iso_to_utc_cached(ts)
+
+
+# Timestamps are immutable and recur across rows and checker ticks, so the
+# parse/format helpers below are memoized on the raw string.
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_to_utc_cached(ts: str) -> Optional[datetime]:
     try:
         s = ts.strip()
         if s.endswith("Z"):
@@ -73,7 +133,16 @@ def _parse_iso_to_local(ts: str) -> Optional[datetime]:
         except Exception:
             return None
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+# Local conversion is only needed for display
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_to_local_cached(ts: str) -> Optional[datetime]:
+    dt = _parse_iso_to_utc_cached(ts)
+    if dt is None:
+        return None
     try:
         return dt.astimezone(LOCAL_TZ)
     except Exception:
@@ -81,61 +150,147 @@ def _parse_iso_to_local(ts: str) -> Optional[datetime]:
 
 
 def _format_time_from_iso(ts: str) -> str:
-    dt_local = _parse_iso_to_local(ts)
+    if not ts:
+        return ""
+    return _format_time_from_iso_cached(ts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_from_iso_cached(ts: str) -> str:
+    dt_local = _parse_iso_to_local_cached(ts)
     if not dt_local:
-        return ts or ""
+        return ts
     return dt_local.strftime("%I:%M %p")
 
 
 def _format_date_display(ts: str) -> str:
-    dt_local = _parse_iso_to_local(ts)
+    if not ts:
+        return ""
+    return _format_date_display_cached(ts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date_display_cached(ts: str) -> str:
+    dt_local = _parse_iso_to_local_cached(ts)
     if not dt_local:
-        return ts or ""
+        return ts
     return dt_local.strftime("%B %d, %Y at %I:%M %p")
 
 
-def run_orchestrator_on_input(raw_text: str) -> dict:
-    orch = create_orchestrator()
-    result = asyncio.run(orch.process_tasks(raw_text))
-    return result
+# Lead times for the high-priority heads-up and the deadline reminder
+_EARLY_DELTA = timedelta(minutes=10)
+_DEADLINE_DELTA = timedelta(minutes=30)
 
 
-def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) -> str:
-    """
-    Convert orchestrator result to Bootstrap-styled HTML schedule.
-    Ensures the header timestamp uses the same created_at_iso that is used for filename + history.
-    Also normalizes priority icons and supports plain-text input like:
-        "Task name (high, 60 min)"
-    """
-    outputs = result.get("outputs", {}) or {}
-    planned = outputs.get("planned", {}) or {}
-    reminders = outputs.get("reminders", {}) or {}
-    evaluation = outputs.get("evaluation", {}) or {}
+def _shift_iso(ts: str, delta: timedelta) -> Optional[str]:
+    """UTC ISO string for ``delta`` before ``ts``; None if it does not parse."""
+    if not ts or not isinstance(ts, str):
+        return None
+    return _shift_iso_cached(ts, delta)
 
-    scheduled = planned.get("scheduled_tasks", []) or []
-    tasks = [t for t in scheduled if t.get("type") == "task"]
-    breaks = [b for b in scheduled if b.get("type") == "break"]
 
-    total_work = sum(int(t.get("duration", 0)) for t in tasks)
-    total_break = sum(int(b.get("duration", 0)) for b in breaks)
-    reminder_count = reminders.get("reminder_count", 0)
+@functools.lru_cache(maxsize=4096)
+def _shift_iso_cached(ts: str, delta: timedelta) -> Optional[str]:
+    dt_utc = _parse_iso_to_utc_cached(ts)
+    if dt_utc is None:
+        return None
+    return (dt_utc - delta).isoformat()
 
-    score = evaluation.get("total_score", 0)
-    grade = evaluation.get("grade", "N/A")
-    scores = evaluation.get("scores_breakdown", {}) or {}
-    recommendations = evaluation.get("recommendations", []) or []
 
-    # Single canonical timestamp for filename + history + header
-    if created_at_iso:
-        now_str = created_at_iso
-    else:
-        now_str = result.get("completed_at") or datetime.utcnow().replace(
-            tzinfo=timezone.utc
-        ).isoformat()
-    gen_display = _format_date_display(now_str)
+def _reminder_date_group(ts: str) -> Tuple[str, str]:
+    """(sortable date key, display date) used to group reminders by local day."""
+    if not ts:
+        return ("unknown", "Unknown Date")
+    return _reminder_date_group_cached(ts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _reminder_date_group_cached(ts: str) -> Tuple[str, str]:
+    dt_local = _parse_iso_to_local_cached(ts)
+    if not dt_local:
+        return ("unknown", "Unknown Date")
+    return (dt_local.strftime("%Y-%m-%d"), dt_local.strftime("%A, %B %d, %Y"))
+
+
+def _get_orchestrator():
+    global _ORCH_SINGLETON
+    if _ORCH_SINGLETON is None:
+        with _ORCH_LOCK:
+            if _ORCH_SINGLETON is None:
+                _ORCH_SINGLETON = create_orchestrator()
+    return _ORCH_SINGLETON
+
+
+# Resubmitting identical text within the TTL reuses the previous run instead
+# of paying for another round of model calls
+ORCH_CACHE_TTL_SECONDS = 3600
+ORCH_CACHE_MAX_ENTRIES = 32
+# sha256(local date + raw_text) -> {"cached_at": monotonic, "result": ..., "html": wrapped
+# schedule HTML or None until rendered}; oldest first
+_ORCH_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_ORCH_CACHE_LOCK = threading.Lock()
+
+
+def _orch_cache_key(raw_text: str) -> str:
+    # Plans are anchored to today, so a new local day never reuses yesterday's
+    day = datetime.now(LOCAL_TZ).date().isoformat()
+    return hashlib.sha256(f"{day}\n{raw_text}".encode("utf-8")).hexdigest()
+
+
+def _orch_cache_entry(key: str, now: float) -> Optional[Dict[str, Any]]:
+    """Live cache entry for key, refreshed as most recent; caller holds the lock."""
+    entry = _ORCH_CACHE.get(key)
+    if entry is None or now - entry["cached_at"] >= ORCH_CACHE_TTL_SECONDS:
+        return None
+    _ORCH_CACHE.move_to_end(key)
+    return entry
+
+
+def _cached_schedule_html(raw_text: str) -> Optional[str]:
+    """Wrapped schedule HTML already rendered for this exact input, if still live."""
+    with _ORCH_CACHE_LOCK:
+        entry = _orch_cache_entry(_orch_cache_key(raw_text), time.monotonic())
+        return entry["html"] if entry else None
+
+
+def _store_schedule_html(raw_text: str, html: str):
+    with _ORCH_CACHE_LOCK:
+        entry = _ORCH_CACHE.get(_orch_cache_key(raw_text))
+        if entry is not None:
+            entry["html"] = html
+
 
-    # --- Header card ---
-    html = f"""
+def run_orchestrator_on_input(raw_text: str) -> dict:
+    key = _orch_cache_key(raw_text)
+    now = time.monotonic()
+    with _ORCH_CACHE_LOCK:
+        entry = _orch_cache_entry(key, now)
+        if entry is not None:
+            # callers may mutate the result; never hand out the cached copy
+            return copy.deepcopy(entry["result"])
+
+    orch = _get_orchestrator()
+    future = asyncio.run_coroutine_threadsafe(orch.process_tasks(raw_text), _LOOP)
+    result = future.result()
+
+    with _ORCH_CACHE_LOCK:
+        _ORCH_CACHE[key] = {"cached_at": now, "result": copy.deepcopy(result), "html": None}
+        _ORCH_CACHE.move_to_end(key)
+        while len(_ORCH_CACHE) > ORCH_CACHE_MAX_ENTRIES:
+            _ORCH_CACHE.popitem(last=False)
+    return result
+
+
+# "(high, 30 min)"-style priority annotation in plain-text task names
+_PRIORITY_RE = re.compile(r"\((high|medium|low)\s*,", re.IGNORECASE)
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+
+# Priority icon keyed by the first three letters of the priority
+_PRIORITY_ICON = {"hig": "🔴", "low": "🟢", "med": "🟡"}
+
+# Schedule page template. Compiled once at import; autoescape keeps
+# user-provided task names, categories and recommendations inert.
+_SCHEDULE_TEMPLATE_SRC = """
 <div class='output-scroll-wrapper'>
   <div class="container-fluid output-container">
 
@@ -147,14 +302,11 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
         </div>
         <div>
           <h5 class="card-title mb-1">Agent Schedule Summary</h5>
-          <p class="card-subtitle small mb-0 opacity-75">{gen_display}</p>
+          <p class="card-subtitle small mb-0 opacity-75">{{ gen_display }}</p>
         </div>
       </div>
     </div>
-"""
 
-    # --- Score / evaluation card ---
-    html += f"""
     <div class="card schedule-card score-card mb-3">
       <div class="card-body">
         <div class="d-flex align-items-center gap-2 mb-3">
@@ -162,43 +314,31 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
             <span class="fs-5">📊</span>
           </div>
           <h5 class="card-title mb-0">
-            Plan Quality · {score:.1f}/100 · Grade {grade}
+            Plan Quality · {{ score }}/100 · Grade {{ grade }}
           </h5>
         </div>
         <div class="score-bars d-flex flex-column gap-3">
-"""
+{% for row in score_rows %}
 
-    for key, value in scores.items():
-        pretty_name = key.replace("_", " ").title()
-        try:
-            v = float(value)
-        except Exception:
-            v = 0.0
-        pct = max(0.0, min(v / 25.0, 1.0)) * 100.0
-        html += f"""
           <div class="score-row row align-items-center g-2">
             <div class="col-12 col-md-3">
-              <span class="score-label text-secondary fw-semibold small">{pretty_name}</span>
+              <span class="score-label text-secondary fw-semibold small">{{ row.name }}</span>
             </div>
             <div class="col">
               <div class="score-bar-container bg-dark rounded-pill overflow-hidden">
-                <div class="score-bar-fill bg-success" style="width: {pct:.1f}%;"></div>
+                <div class="score-bar-fill bg-success" style="width: {{ row.pct }}%;"></div>
               </div>
             </div>
             <div class="col-auto">
-              <span class="score-num fw-bold small">{v:.1f}/25</span>
+              <span class="score-num fw-bold small">{{ row.value }}/25</span>
             </div>
           </div>
-"""
+{% endfor %}
 
-    html += """
         </div>
       </div>
     </div>
-"""
 
-    # --- Overview stats ---
-    html += f"""
     <div class="card schedule-card overview-card mb-3">
       <div class="card-body">
         <div class="d-flex align-items-center gap-2 mb-3">
@@ -210,27 +350,24 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
         <div class="overview-grid">
           <div class="overview-item">
             <div class="ov-label">Total Tasks</div>
-            <div class="ov-value">{len(tasks)}</div>
+            <div class="ov-value">{{ task_count }}</div>
           </div>
           <div class="overview-item">
             <div class="ov-label">Planned Work</div>
-            <div class="ov-value">{total_work // 60}h {total_work % 60}m</div>
+            <div class="ov-value">{{ total_work // 60 }}h {{ total_work % 60 }}m</div>
           </div>
           <div class="overview-item">
             <div class="ov-label">Planned Breaks</div>
-            <div class="ov-value">{total_break // 60}h {total_break % 60}m</div>
+            <div class="ov-value">{{ total_break // 60 }}h {{ total_break % 60 }}m</div>
           </div>
           <div class="overview-item">
             <div class="ov-label">Reminders</div>
-            <div class="ov-value">{reminder_count}</div>
+            <div class="ov-value">{{ reminder_count }}</div>
           </div>
         </div>
       </div>
     </div>
-"""
 
-    # --- Timeline (tasks + breaks) ---
-    html += """
     <div class="card schedule-card tasks-card mb-3">
       <div class="card-body">
         <div class="d-flex align-items-center gap-2 mb-3">
@@ -240,74 +377,35 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
           <h5 class="card-title mb-0">Agent Timeline</h5>
         </div>
         <div class="tasks-list">
-"""
-
-    for item in scheduled:
-        item_type = (item.get("type") or "task").lower()
-        if item_type == "task":
-            start = _format_time_from_iso(item.get("start_time", ""))
-            end = _format_time_from_iso(item.get("end_time", ""))
-            dur = int(item.get("duration", 0))
-
-            raw_name = item.get("name") or ""
-            display_name = raw_name
-
-            # detect priority, first from structured field:
-            raw_pr = (item.get("priority") or "").strip().lower()
-
-            # if that is missing / generic, try to infer from "(high, 30 min)" pattern in the name
-            m = re.search(r"\((high|medium|low)\s*,", raw_name, flags=re.IGNORECASE)
-            if m:
-                raw_pr = m.group(1).lower()
-                # clean the name to remove the "(high, 30 min)" annotation
-                display_name = re.sub(r"\s*\([^)]*\)\s*$", "", raw_name).strip()
-
-            # normalize and map to icon
-            if raw_pr.startswith("high"):
-                icon = "🔴"
-            elif raw_pr.startswith("low"):
-                icon = "🟢"
-            elif raw_pr.startswith("med"):
-                icon = "🟡"
-            else:
-                icon = "🟡"
+{% for item in timeline %}
+{% if item.is_task %}
 
-            category = (item.get("category") or "General").title()
-
-            html += f"""
           <div class="task-item d-flex align-items-start gap-2">
-            <div class="task-priority-icon flex-shrink-0 pt-1">{icon}</div>
+            <div class="task-priority-icon flex-shrink-0 pt-1">{{ item.icon }}</div>
             <div class="task-details">
-              <div class="task-name">{display_name}</div>
+              <div class="task-name">{{ item.name }}</div>
               <div class="task-meta small text-secondary">
-                <span class="me-2">⏱️ {start} - {end} ({dur} min)</span>
-                <span>🏷️ {category}</span>
+                <span class="me-2">⏱️ {{ item.start }} - {{ item.end }} ({{ item.dur }} min)</span>
+                <span>🏷️ {{ item.category }}</span>
               </div>
             </div>
           </div>
-"""
-        else:
-            start = _format_time_from_iso(item.get("start_time", ""))
-            end = _format_time_from_iso(item.get("end_time", ""))
-            dur = int(item.get("duration", 0))
-            html += f"""
+{% else %}
+
           <div class="break-item d-flex align-items-start gap-2">
             <div class="break-icon flex-shrink-0 pt-1">☕</div>
             <div class="break-details">
-              <span class="break-time d-block">{start} - {end}</span>
-              <span class="break-duration small text-secondary">({dur} min break)</span>
+              <span class="break-time d-block">{{ item.start }} - {{ item.end }}</span>
+              <span class="break-duration small text-secondary">({{ item.dur }} min break)</span>
             </div>
           </div>
-"""
+{% endif %}
+{% endfor %}
 
-    html += """
         </div>
       </div>
     </div>
-"""
 
-    # --- Tips & recommendations ---
-    html += """
     <div class="card schedule-card tips-card mb-3">
       <div class="card-body">
         <div class="d-flex align-items-center gap-2 mb-3">
@@ -317,17 +415,14 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
           <h5 class="card-title mb-0">Tips & Recommendations</h5>
         </div>
         <ul class="tips-list list-unstyled mb-0">
-"""
-    if recommendations:
-        for rec in recommendations:
-            html += f"          <li>{rec}</li>\n"
-    else:
-        html += """          <li>Take regular breaks to stay focused.</li>
+{% for rec in recommendations %}
+          <li>{{ rec }}</li>
+{% else %}
+          <li>Take regular breaks to stay focused.</li>
           <li>Start your day with the highest-priority tasks.</li>
           <li>Review the plan mid-day and adjust if needed.</li>
-"""
+{% endfor %}
 
-    html += """
         </ul>
       </div>
     </div>
@@ -335,155 +430,674 @@ def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) ->
   </div>
 </div>
 """
-    return html
 
+_SCHEDULE_TEMPLATE = jinja2.Environment(
+    autoescape=True,
+    trim_blocks=True,
+    keep_trailing_newline=True,
+).from_string(_SCHEDULE_TEMPLATE_SRC)
 
-def _save_history_entry(html_content: str, meta: dict) -> dict:
-    os.makedirs(OUTPUTS_DIR, exist_ok=True)
+# Template events buffered per streamed chunk; roughly one card or row
+_STREAM_CHUNK_EVENTS = 32
+
+
+# Shared read-only defaults for missing or empty result sections
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_SEQ: tuple = ()
+
+
+def _g(d, key, default):
+    """d[key] if present and truthy, else the shared default (never mutated)."""
+    v = d.get(key)
+    return v if v else default
+
+
+def _schedule_context(result: dict, created_at_iso: Optional[str] = None) -> dict:
+    """Extract and pre-format everything the schedule template renders."""
+    outputs = _g(result, "outputs", _EMPTY_DICT)
+    planned = _g(outputs, "planned", _EMPTY_DICT)
+    reminders = _g(outputs, "reminders", _EMPTY_DICT)
+    evaluation = _g(outputs, "evaluation", _EMPTY_DICT)
+
+    scheduled = _g(planned, "scheduled_tasks", _EMPTY_SEQ)
+    reminder_count = reminders.get("reminder_count", 0)
+
+    score = evaluation.get("total_score", 0)
+    grade = evaluation.get("grade", "N/A")
+    scores = _g(evaluation, "scores_breakdown", _EMPTY_DICT)
+    recommendations = _g(evaluation, "recommendations", _EMPTY_SEQ)
+
+    # Single canonical timestamp for filename + history + header
+    if created_at_iso:
+        now_str = created_at_iso
+    else:
+        now_str = result.get("completed_at") or datetime.now(timezone.utc).isoformat()
+    gen_display = _format_date_display(now_str)
+
+    score_rows = []
+    for key, value in scores.items():
+        pretty_name = key.replace("_", " ").title()
+        try:
+            v = float(value)
+        except Exception:
+            v = 0.0
+        pct = max(0.0, min(v / 25.0, 1.0)) * 100.0
+        score_rows.append({"name": pretty_name, "pct": f"{pct:.1f}", "value": f"{v:.1f}"})
 
+    # Totals and timeline rows in a single pass over the schedule
+    timeline = []
+    task_count = total_work = total_break = 0
+    for item in scheduled:
+        raw_type = item.get("type")
+        dur = int(item.get("duration", 0))
+        if raw_type == "task":
+            task_count += 1
+            total_work += dur
+        elif raw_type == "break":
+            total_break += dur
+
+        item_type = (raw_type or "task").lower()
+        start = _format_time_from_iso(item.get("start_time", ""))
+        end = _format_time_from_iso(item.get("end_time", ""))
+        if item_type != "task":
+            timeline.append({"is_task": False, "start": start, "end": end, "dur": dur})
+            continue
+
+        raw_name = item.get("name") or ""
+        display_name = raw_name
+
+        # detect priority, first from structured field:
+        raw_pr = (item.get("priority") or "").strip().lower()
+
+        # if that is missing / generic, try to infer from "(high, 30 min)" pattern in the name
+        m = _PRIORITY_RE.search(raw_name)
+        if m:
+            raw_pr = m.group(1).lower()
+            # clean the name to remove the "(high, 30 min)" annotation
+            display_name = _TRAILING_PAREN_RE.sub("", raw_name).strip()
+
+        timeline.append({
+            "is_task": True,
+            # normalize and map to icon (medium / unknown -> yellow)
+            "icon": _PRIORITY_ICON.get(raw_pr[:3], "🟡"),
+            "name": display_name,
+            "start": start,
+            "end": end,
+            "dur": dur,
+            "category": (item.get("category") or "General").title(),
+        })
+
+    return {
+        "gen_display": gen_display,
+        "score": f"{score:.1f}",
+        "grade": grade,
+        "score_rows": score_rows,
+        "task_count": task_count,
+        "total_work": total_work,
+        "total_break": total_break,
+        "reminder_count": reminder_count,
+        "timeline": timeline,
+        "recommendations": recommendations,
+    }
+
+
+def format_schedule_html(result: dict, created_at_iso: Optional[str] = None) -> str:
+    """
+    Convert orchestrator result to Bootstrap-styled HTML schedule.
+    Ensures the header timestamp uses the same created_at_iso that is used for filename + history.
+    Also normalizes priority icons and supports plain-text input like:
+        "Task name (high, 60 min)"
+    """
+    return "".join(stream_schedule_html(result, created_at_iso))
+
+
+def stream_schedule_html(result: dict, created_at_iso: Optional[str] = None) -> Iterator[str]:
+    """Yield the schedule HTML in chunks so the UI can paint the header first."""
+    stream = _SCHEDULE_TEMPLATE.stream(**_schedule_context(result, created_at_iso))
+    stream.enable_buffering(_STREAM_CHUNK_EVENTS)
+    return iter(stream)
+
+
+def _save_history_entry(html_content: str, meta: dict) -> dict:
     # get a single canonical timestamp, defaulting to now UTC
-    created_at = meta.get("created_at") or datetime.utcnow().replace(
-        tzinfo=timezone.utc
-    ).isoformat()
+    created_at = meta.get("created_at") or datetime.now(timezone.utc).isoformat()
 
     # use it for filename (sanitized) and index
     ts_for_filename = created_at.replace(":", "-").replace(".", "-")
     filename = f"schedule_{ts_for_filename}.html"
     path = os.path.join(OUTPUTS_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    index: List[dict] = []
-    if os.path.exists(HISTORY_INDEX):
-        try:
-            with open(HISTORY_INDEX, "r", encoding="utf-8") as f:
-                index = json.load(f)
-        except Exception:
-            index = []
+    Path(path).write_text(html_content, encoding="utf-8")
 
     entry = {
         "id": filename,
         "title": meta.get("title", "Schedule"),
         "created_at": created_at,
     }
-    index.insert(0, entry)
-    index = index[:500]
-    with open(HISTORY_INDEX, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2)
+    global _HISTORY_STAMP, _HISTORY_SNAPSHOT, _history_log_lines
+    # Mutate the in-memory index and append to the journal; the full index is
+    # only rewritten once the journal grows past HISTORY_LOG_COMPACT_LINES
+    with _HISTORY_LOCK:
+        _HISTORY_INDEX.insert(0, entry)
+        del _HISTORY_INDEX[HISTORY_MAX_ENTRIES:]
+        with open(HISTORY_LOG, "ab") as f:
+            f.write(_json_dumps(entry, indent=False) + b"\n")
+        _history_log_lines += 1
+        if _history_log_lines >= HISTORY_LOG_COMPACT_LINES:
+            Path(HISTORY_INDEX).write_bytes(_json_dumps(_HISTORY_INDEX))
+            open(HISTORY_LOG, "wb").close()
+            _history_log_lines = 0
+        _HISTORY_STAMP = _history_stamp()
+        _HISTORY_SNAPSHOT = None
+    _read_history_file_cached.cache_clear()
     return entry
 
 
-def _load_history_index() -> List[dict]:
-    if os.path.exists(HISTORY_INDEX):
+_history_log_lines = 0
+
+
+def _read_history_index_file() -> List[dict]:
+    """Compacted index (newest first) with journal entries replayed on top."""
+    global _history_log_lines
+    try:
+        index = _json_loads(Path(HISTORY_INDEX).read_bytes())
+        if not isinstance(index, list):
+            index = []
+    except Exception:
+        index = []
+    logged = []
+    try:
+        with open(HISTORY_LOG, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        logged.append(_json_loads(line))
+                    except Exception:
+                        continue  # torn final line from an interrupted append
+    except FileNotFoundError:
+        pass
+    _history_log_lines = len(logged)
+    logged.reverse()
+    # A crash between writing the compacted index and truncating the journal
+    # leaves entries in both; keep the first (newest) copy of each id
+    merged: List[dict] = []
+    seen_ids = set()
+    for e in itertools.chain(logged, index):
+        eid = e.get("id") if isinstance(e, dict) else None
+        if eid in seen_ids:
+            continue
+        seen_ids.add(eid)
+        merged.append(e)
+        if len(merged) >= HISTORY_MAX_ENTRIES:
+            break
+    return merged
+
+
+def _history_stamp() -> Tuple[Optional[int], Optional[int]]:
+    """mtimes of the index and its journal; either changing means a reload."""
+    stamps = []
+    for path in (HISTORY_INDEX, HISTORY_LOG):
         try:
-            with open(HISTORY_INDEX, "r", encoding="utf-8") as f:
-                return json.load(f)
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+# History index is kept in memory and only re-parsed when the files' mtimes
+# change underneath us (e.g. edited by another process)
+_HISTORY_LOCK = threading.Lock()
+_HISTORY_INDEX: List[dict] = _read_history_index_file()
+_HISTORY_STAMP: Tuple[Optional[int], Optional[int]] = _history_stamp()
+# Immutable copy handed to readers; rebuilt only after the index changes
+_HISTORY_SNAPSHOT: Optional[Tuple[dict, ...]] = None
+
+
+def _load_history_index() -> Tuple[dict, ...]:
+    global _HISTORY_STAMP, _HISTORY_SNAPSHOT
+    stamp = _history_stamp()
+    with _HISTORY_LOCK:
+        if stamp != _HISTORY_STAMP:
+            _HISTORY_INDEX[:] = _read_history_index_file()
+            _HISTORY_STAMP = stamp
+            _HISTORY_SNAPSHOT = None
+        if _HISTORY_SNAPSHOT is None:
+            _HISTORY_SNAPSHOT = tuple(_HISTORY_INDEX)
+        return _HISTORY_SNAPSHOT
+
+
+# Most recent entries offered in the history dropdown
+HISTORY_CHOICES_LIMIT = 100
+# (snapshot the choices were built from, choices); rebuilt when the snapshot changes
+_HISTORY_CHOICES: Optional[Tuple[Tuple[dict, ...], List[Tuple[str, str]]]] = None
+
+
+def _history_choices() -> List[Tuple[str, str]]:
+    """(label, id) dropdown choices for the newest history entries."""
+    global _HISTORY_CHOICES
+    idx = _load_history_index()
+    cached = _HISTORY_CHOICES
+    if cached is not None and cached[0] is idx:
+        return cached[1]
+    choices = []
+    for e in idx[:HISTORY_CHOICES_LIMIT]:
+        try:
+            label = _format_date_display(e.get("created_at"))
         except Exception:
-            return []
-    return []
+            label = e.get("id", "Schedule")
+        choices.append((label, e.get("id")))
+    _HISTORY_CHOICES = (idx, choices)
+    return choices
 
 
 def _read_history_file(filename: str) -> str:
     if not filename or not isinstance(filename, str):
         return "<div class='card schedule-card'><div class='card-body'><h5 class='card-title mb-0'>Not found</h5></div></div>"
+    return _read_history_file_cached(filename)
+
+
+def _history_page_data() -> Tuple[List[Tuple[str, str]], Optional[str], str]:
+    """(dropdown choices, default id, preview HTML) for the history page."""
+    # choices are cached per index snapshot; only today's entry is looked up
+    choices = _history_choices()
+    today_id = None
+    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    for e in _load_history_index()[:HISTORY_CHOICES_LIMIT]:
+        created_at = e.get("created_at")
+        if isinstance(created_at, str) and created_at[:10] == today_str:
+            today_id = e.get("id")
+            break
+
+    # fallback to latest if no today schedule
+    default_id = today_id or (choices[0][1] if choices else None)
+
+    preview_html = (
+        _read_history_file(default_id)
+        if default_id
+        else "<div style='padding:24px;'>No history available.</div>"
+    )
+    return choices, default_id, preview_html
+
+
+# Saved schedules are immutable once written; cache recent previews (bounded,
+# since each entry is a full HTML page) and clear on every save
+@functools.lru_cache(maxsize=64)
+def _read_history_file_cached(filename: str) -> str:
     path = os.path.join(OUTPUTS_DIR, filename)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+    try:
+        return Path(path).read_text("utf-8", errors="replace")
+    except FileNotFoundError:
+        pass
     return "<div class='card schedule-card'><div class='card-body'><h5 class='card-title mb-0'>Not found</h5></div></div>"
 
 
+def _parse_manual_reminder(text: str) -> Tuple[str, str]:
+    """(message, UTC ISO time) from the manual box; unparsable times mean now."""
+    parsed_time = None
+    msg = text.strip()
+    m = _AT_TIME_RE.match(msg)
+    if m:
+        # "<message> at H:MM AM" -> today at that time
+        try:
+            dt_try = datetime.strptime(f"{m.group(2)} {m.group(3)}", "%I:%M %p")
+            today = datetime.now(timezone.utc).date()
+            combined = datetime.combine(today, dt_try.time())
+            parsed_time = combined.replace(tzinfo=timezone.utc).isoformat()
+            msg = m.group(1).strip() or "Reminder"
+        except ValueError:
+            pass
+    if parsed_time is None and " at " in msg:
+        # "<message> at <ISO timestamp>"
+        dt_utc = _parse_iso_to_utc(msg.rsplit(" at ", 1)[1].strip())
+        if dt_utc is not None:
+            parsed_time = dt_utc.isoformat()
+    if parsed_time is None:
+        parsed_time = datetime.now(timezone.utc).isoformat()
+    return msg, parsed_time
+
+
+# Suffix that keeps session filenames unique within the same second
+_SESSION_COUNTER = itertools.count()
+
+
 def _write_reminders_file(entries: List[dict]) -> str:
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
-    filename = f"reminders_session_{ts}.json"
-    path = os.path.join(OUTPUTS_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, default=str)
-    return path
+    data = _json_dumps(entries)
+    while True:
+        filename = f"reminders_session_{int(time.time())}_{next(_SESSION_COUNTER)}.json"
+        path = os.path.join(OUTPUTS_DIR, filename)
+        # Exclusive create: the counter restarts with the process and is not
+        # shared between workers, so never overwrite someone else's file
+        try:
+            with open(path, "xb") as f:
+                f.write(data)
+        except FileExistsError:
+            continue
+        return path
+
+
+# path -> (mtime_ns, size, parsed reminders); files are only re-parsed
+# when their stat changes
+_REMINDERS_CACHE: Dict[str, Tuple[int, int, List[dict]]] = {}
+
+# Reminders from newly (re)parsed files, drained by the checker thread
+_FRESH_REMINDERS: List[dict] = []
+_FRESH_LOCK = threading.Lock()
+
+# Checker state: min-heap of (epoch_utc, unique_id, reminder) still due to
+# fire, and the IDs currently on it so re-parsed files are not re-queued
+# (once fired, the fired map takes over)
+_REMINDER_HEAP: List[Tuple[float, str, dict]] = []
+_SEEN_IDS: set = set()
+
+
+def _read_one_session(path: str) -> Optional[List[dict]]:
+    """Parse one reminders session file; None if it cannot be read."""
+    try:
+        data = _json_loads(Path(path).read_bytes())
+    except Exception:
+        return None
+    return data if isinstance(data, list) else []
 
 
 def _load_all_reminders() -> List[dict]:
-    reminders: List[dict] = []
-    for fname in os.listdir(OUTPUTS_DIR):
-        if fname.startswith("reminders_session_") and fname.endswith(".json"):
+    global _REMINDERS_CACHE
+    # (path, mtime_ns, size, cached data or None when stale), in scan order
+    scanned: List[Tuple[str, int, int, Optional[List[dict]]]] = []
+    with os.scandir(OUTPUTS_DIR) as it:
+        for entry in it:
+            fname = entry.name
+            if not (fname.startswith("reminders_session_") and fname.endswith(".json")):
+                continue
             try:
-                path = os.path.join(OUTPUTS_DIR, fname)
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        reminders.extend(data)
-            except Exception:
+                st = entry.stat()
+            except OSError:
+                continue
+            cached = _REMINDERS_CACHE.get(entry.path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                scanned.append((entry.path, st.st_mtime_ns, st.st_size, cached[2]))
+            else:
+                scanned.append((entry.path, st.st_mtime_ns, st.st_size, None))
+
+    # Only stale files are parsed; several at once go through a thread pool
+    stale = [path for path, _, _, data in scanned if data is None]
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+            parsed = dict(zip(stale, ex.map(_read_one_session, stale)))
+    else:
+        parsed = {path: _read_one_session(path) for path in stale}
+
+    reminders: List[dict] = []
+    cache: Dict[str, Tuple[int, int, List[dict]]] = {}
+    for path, mtime_ns, size, data in scanned:
+        if data is None:
+            data = parsed[path]
+            if data is None:
                 continue
+            with _FRESH_LOCK:
+                _FRESH_REMINDERS.extend(data)
+        cache[path] = (mtime_ns, size, data)
+        reminders.extend(data)
+    _REMINDERS_CACHE = cache
     return reminders
 
 
-def _persist_fired(fired_set: set):
+def _reminders_for_schedule(result: dict) -> List[dict]:
+    """Start, high-priority early and deadline reminders for a planned schedule."""
+    outputs = _g(result, "outputs", _EMPTY_DICT)
+    planned = _g(outputs, "planned", _EMPTY_DICT)
+    scheduled = _g(planned, "scheduled_tasks", _EMPTY_SEQ)
+    reminders_to_save: List[dict] = []
+
+    for item in scheduled:
+        if item.get("type") == "task":
+            start_iso = item.get("start_time")
+            if start_iso:
+                reminders_to_save.append(
+                    {
+                        "id": f"task_start_{item.get('name')}_{start_iso}",
+                        "scheduled_time": start_iso,
+                        "message": f"Start: {item.get('name')}",
+                    }
+                )
+                raw_pr = (item.get("priority") or "").strip().lower()
+                is_high = raw_pr.startswith("high")
+                if is_high:
+                    early_utc = _shift_iso(start_iso, _EARLY_DELTA)
+                    if early_utc:
+                        reminders_to_save.append(
+                            {
+                                "id": f"task_high_alert_{item.get('name')}_{early_utc}",
+                                "scheduled_time": early_utc,
+                                "message": f"Upcoming (high-priority): {item.get('name')}",
+                            }
+                        )
+            due = item.get("due_date")
+            if due:
+                deadline_utc = _shift_iso(due, _DEADLINE_DELTA)
+                if deadline_utc:
+                    reminders_to_save.append(
+                        {
+                            "id": f"task_due_{item.get('name')}_{deadline_utc}",
+                            "scheduled_time": deadline_utc,
+                            "message": f"Deadline soon: {item.get('name')}",
+                        }
+                    )
+    return reminders_to_save
+
+
+def _save_new_reminders(reminders: List[dict]) -> List[dict]:
+    """Write the reminders whose IDs are not on disk yet; returns those written."""
+    # Regenerating the same plan must not write (and fire) duplicates
+    if not reminders:
+        return []
+    seen_ids = {r.get("id") for r in _load_all_reminders()}
+    unique = []
+    for r in reminders:
+        if r["id"] not in seen_ids:
+            seen_ids.add(r["id"])
+            unique.append(r)
+    if unique:
+        _write_reminders_file(unique)
+    return unique
+
+
+_fired_log_lines = 0
+
+
+def _persist_fired(newly_fired: List[str], fired: "OrderedDict[str, float]"):
+    """Append newly fired IDs to the log; compact into JSON once it grows large."""
+    global _fired_log_lines
+    if not newly_fired:
+        return
     try:
-        with open(REMINDERS_FIRED, "w", encoding="utf-8") as f:
-            json.dump(list(fired_set), f)
+        with open(REMINDERS_FIRED_LOG, "ab") as f:
+            f.write(b"".join(
+                _json_dumps({"id": uid, "ts": fired[uid]}, indent=False) + b"\n"
+                for uid in newly_fired
+            ))
+        _fired_log_lines += len(newly_fired)
+
+        if _fired_log_lines >= FIRED_LOG_COMPACT_LINES:
+            _prune_fired(fired, time.time())
+            with open(REMINDERS_FIRED, "wb") as f:
+                f.write(_json_dumps(fired, indent=False))
+                f.flush()
+                os.fsync(f.fileno())
+            open(REMINDERS_FIRED_LOG, "wb").close()
+            _fired_log_lines = 0
     except Exception:
         pass
 
 
-def _load_fired() -> set:
-    if not os.path.exists(REMINDERS_FIRED):
-        return set()
+def _prune_fired(fired: "OrderedDict[str, float]", now_ts: float):
+    """Drop fired IDs past the retention window; oldest entries come first."""
+    cutoff = now_ts - FIRED_RETENTION_SECONDS
+    while fired and next(iter(fired.values())) < cutoff:
+        fired.popitem(last=False)
+
+
+def _parse_fired_line(line: bytes) -> Optional[Tuple[str, float]]:
+    """(id, fired-at epoch) from one log line; accepts the older "id\tts" form."""
     try:
-        with open(REMINDERS_FIRED, "r", encoding="utf-8") as f:
-            arr = json.load(f)
-            return set(arr if isinstance(arr, list) else [])
+        rec = _json_loads(line)
+        return str(rec["id"]), float(rec["ts"])
     except Exception:
-        return set()
+        pass
+    uid, _, ts = line.decode("utf-8", errors="replace").rstrip("\r\n").rpartition("\t")
+    try:
+        return (uid, float(ts)) if uid else None
+    except ValueError:
+        return None
+
+
+def _load_fired() -> "OrderedDict[str, float]":
+    """Load fired ID -> fired-at epoch, oldest first, pruned to the retention window."""
+    global _fired_log_lines
+    now_ts = time.time()
+    fired: "OrderedDict[str, float]" = OrderedDict()
+    try:
+        with open(REMINDERS_FIRED, "rb") as f:
+            data = _json_loads(f.read())
+        if isinstance(data, dict):
+            fired.update(data)
+        elif isinstance(data, list):
+            # legacy snapshot without timestamps; keep for one window
+            fired.update(dict.fromkeys(data, now_ts))
+    except Exception:
+        pass
+    logged = 0
+    try:
+        with open(REMINDERS_FIRED_LOG, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                logged += 1
+                # A bad line (e.g. a torn append) only loses itself
+                rec = _parse_fired_line(line)
+                if rec is not None:
+                    fired[rec[0]] = rec[1]
+    except FileNotFoundError:
+        pass
+    _fired_log_lines = logged
+    _prune_fired(fired, now_ts)
+    return fired
+
+
+def _schedule_reminders(reminders: List[dict], fired: "OrderedDict[str, float]"):
+    """Push not-yet-fired reminders onto the heap, keyed by UTC epoch."""
+    cutoff = time.time() - FIRED_RETENTION_SECONDS
+    for rem in reminders:
+        st = rem.get("scheduled_time") or rem.get("time") or rem.get("when")
+        if not st:
+            continue
+        unique_id = rem.get("id") or (rem.get("message") or "") + "_" + str(st)
+        if unique_id in fired or unique_id in _SEEN_IDS:
+            continue
+        scheduled_dt_utc = _parse_iso_to_utc(st)
+        if scheduled_dt_utc is None:
+            continue
+        scheduled_ts = scheduled_dt_utc.timestamp()
+        # Past the retention window its fired record may be gone; never re-fire
+        if scheduled_ts < cutoff:
+            continue
+        _SEEN_IDS.add(unique_id)
+        heapq.heappush(_REMINDER_HEAP, (scheduled_ts, unique_id, rem))
+
+
+class _NotifySubscriber:
+    """One tab's notification stream.
+
+    pending is only touched under NOTIFICATION_LOCK, so whatever a stream has
+    not taken when it unsubscribes is known exactly; wake is set from other
+    threads through the stream's loop.
+    """
+
+    __slots__ = ("session_hash", "loop", "pending", "wake")
+
+    def __init__(self, session_hash: Optional[str], loop: asyncio.AbstractEventLoop):
+        self.session_hash = session_hash
+        self.loop = loop
+        self.pending: List[dict] = []
+        self.wake = asyncio.Event()
+
+
+def _publish_notification(notif: dict):
+    """Push to every connected stream (thread-safe), or buffer if none."""
+    with NOTIFICATION_LOCK:
+        if not _NOTIFY_SUBSCRIBERS:
+            NOTIFICATION_BUFFER.append(notif)
+            return
+        for sub in _NOTIFY_SUBSCRIBERS:
+            sub.pending.append(notif)
+            sub.loop.call_soon_threadsafe(sub.wake.set)
+
+
+def _unsubscribe_notifications(session_hash: Optional[str]):
+    """Drop a closed tab's streams and wake them so they can exit."""
+    with NOTIFICATION_LOCK:
+        closed = [sub for sub in _NOTIFY_SUBSCRIBERS if sub.session_hash == session_hash]
+        _NOTIFY_SUBSCRIBERS.difference_update(closed)
+    for sub in closed:
+        sub.loop.call_soon_threadsafe(sub.wake.set)
 
 
 def _reminder_checker_loop(interval_seconds: int = 30):
     fired = _load_fired()
-    while not STOP_THREAD:
+    while not _STOP_EVENT.is_set():
+        now_ts = time.time()
         try:
-            all_reminders = _load_all_reminders()
-            now = datetime.utcnow().replace(tzinfo=timezone.utc)
-            for rem in all_reminders:
+            # Refreshes the file cache; changed files land in _FRESH_REMINDERS
+            _load_all_reminders()
+            with _FRESH_LOCK:
+                fresh = _FRESH_REMINDERS[:]
+                _FRESH_REMINDERS.clear()
+            _schedule_reminders(fresh, fired)
+
+            now_ts = time.time()
+            newly_fired: List[str] = []
+            while _REMINDER_HEAP and _REMINDER_HEAP[0][0] <= now_ts + 1:
+                _, unique_id, rem = heapq.heappop(_REMINDER_HEAP)
+                _SEEN_IDS.discard(unique_id)
                 st = rem.get("scheduled_time") or rem.get("time") or rem.get("when")
-                if not st:
-                    continue
-                scheduled_dt_local = _parse_iso_to_local(st)
-                if scheduled_dt_local is None:
-                    continue
-                try:
-                    scheduled_dt_utc = scheduled_dt_local.astimezone(timezone.utc)
-                except Exception:
-                    scheduled_dt_utc = scheduled_dt_local.replace(tzinfo=timezone.utc)
-                unique_id = rem.get("id") or (rem.get("message") or "") + "_" + str(st)
-                if unique_id in fired:
-                    continue
-                if scheduled_dt_utc <= now + timedelta(seconds=1):
-                    notif = {
-                        "id": unique_id,
-                        "message": rem.get("message") or rem.get("text") or "Reminder",
-                        "scheduled_time": st,
-                        "meta": rem,
-                    }
-                    with NOTIFICATION_LOCK:
-                        NOTIFICATION_BUFFER.append(notif)
-                    fired.add(unique_id)
-            _persist_fired(fired)
+                notif = {
+                    "id": unique_id,
+                    "message": rem.get("message") or rem.get("text") or "Reminder",
+                    "scheduled_time": st,
+                    "meta": rem,
+                }
+                _publish_notification(notif)
+                fired[unique_id] = now_ts
+                newly_fired.append(unique_id)
+            _persist_fired(newly_fired, fired)
+            _prune_fired(fired, now_ts)
         except Exception:
             pass
-        for _ in range(int(interval_seconds / 1)):
-            if STOP_THREAD:
-                break
-            time.sleep(1)
+        # Wake for the next due reminder, but still rescan files every interval
+        wait = interval_seconds
+        if _REMINDER_HEAP:
+            wait = min(interval_seconds, max(1, _REMINDER_HEAP[0][0] - now_ts))
+        if _STOP_EVENT.wait(timeout=wait):
+            break
+
+
+def stop_checker():
+    """Stop the reminder checker thread; it exits without finishing its wait."""
+    _STOP_EVENT.set()
 
 
+# Own thread rather than a task on _LOOP: its file scans and fsyncs must not
+# hold up submissions, and a synchronous orchestrator run must not delay
+# reminders
 checker_thread = threading.Thread(
     target=_reminder_checker_loop, args=(30,), daemon=True
 )
 checker_thread.start()
 
 
-def build_ui():
-    # --- Bootstrap-based styling (light custom CSS only for layout + theme) ---
-    css = r"""
+# ---------- Static UI markup (built once at import) ----------
+
+# Bootstrap-based styling (light custom CSS only for layout + theme)
+_CSS = r"""
 @import url('https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css');
 
 /* ---------- Color system (inspired by your screenshot) ---------- */
@@ -1046,12 +1660,7 @@ button.sidebar-btn {
 }
 """
 
-    with gr.Blocks(css=css, title="Personal Productivity Agent", theme=gr.themes.Soft()) as demo:
-        with gr.Column(elem_classes="main-container"):
-            # ---------- SIDEBAR ----------
-            with gr.Column(scale=0, elem_classes="sidebar"):
-                gr.HTML(
-                    """
+_SIDEBAR_HEADER_HTML = """
                 <div class="sidebar-nav-header">
                     <div class="sidebar-title-block">
                         <div class="sidebar-avatar">PA</div>
@@ -1062,16 +1671,8 @@ button.sidebar-btn {
                     </div>
                 </div>
                 """
-                )
 
-                # Navigation buttons (classes toggled in Python)
-                btn_new = gr.Button(" New Schedule", elem_classes="sidebar-btn sidebar-btn-active")
-                btn_history = gr.Button(" History", elem_classes="sidebar-btn")
-                btn_reminders = gr.Button(" Reminders", elem_classes="sidebar-btn")
-                btn_help = gr.Button(" Help & Guide", elem_classes="sidebar-btn")
-
-                gr.HTML(
-                    """
+_PRIORITY_LEGEND_HTML = """
                     <div style="padding:12px">
                         <div style="font-size:11px;color:#9ca3af;font-weight:600;margin-bottom:6px;text-transform:uppercase;letter-spacing:.08em;">Priority Legend</div>
                         <div class="border rounded-3 p-2" style="font-size:12px;border-color:rgba(148,163,184,0.4)!important;background:rgba(15,23,42,0.92);">
@@ -1081,20 +1682,15 @@ button.sidebar-btn {
                         </div>
                     </div>
                 """
-                )
-                gr.HTML(
-                    """
+
+_SIDEBAR_FOOTER_HTML = """
                     <div class="sidebar-footer">
                         <div>Powered by Gemini-based orchestration.</div>
                         <div>Designed for structured, reliable planning.</div>
                     </div>
                 """
-                )
 
-            # ---------- MAIN AREA ----------
-            with gr.Column(scale=4, elem_classes="content-area"):
-                gr.HTML(
-                    """
+_CONTENT_HEADER_HTML = """
                     <div class="content-header">
                         <div>
                             <div class="content-title">Personal Productivity Agent</div>
@@ -1102,52 +1698,12 @@ button.sidebar-btn {
                         </div>
                     </div>
                     """
-                )
 
-                notification_area = gr.HTML(
-                    "<div class='toast-wrap' id='toast_wrap'></div>", elem_id="notification_area"
-                )
+_EMPTY_STATE_HTML = "<div class='output-scroll-wrapper'><div class='output-area'><div class='empty-state'><div class='empty-icon'>🤖</div><h3>Ready to plan your day with the agent?</h3><p>Type your tasks, meetings and constraints below. The agent will respond with a full schedule.</p></div></div></div>"
 
-                # New Schedule output
-                new_output_html = gr.HTML(
-                    "<div class='output-scroll-wrapper'><div class='output-area'><div class='empty-state'><div class='empty-icon'>🤖</div><h3>Ready to plan your day with the agent?</h3><p>Type your tasks, meetings and constraints below. The agent will respond with a full schedule.</p></div></div></div>",
-                    elem_id="new_output",
-                )
+_HISTORY_PLACEHOLDER_HTML = "<div style='padding:24px;'>History preview will appear here.</div>"
 
-                # History section (hidden by default)
-                history_label = gr.Markdown("**Saved Schedules**", visible=False)
-                history_dropdown = gr.Dropdown(
-                    choices=[],
-                    label="",
-                    show_label=False,
-                    elem_id="history_dropdown",
-                    visible=False,
-                    interactive=True,
-                    allow_custom_value=True,
-                    type="value",
-                )
-
-                history_preview = gr.HTML(
-                    "<div style='padding:24px;'>History preview will appear here.</div>",
-                    elem_id="history_preview",
-                    visible=False,
-                )
-
-                # Reminders section (hidden by default)
-                reminder_input = gr.Textbox(
-                    show_label=False,
-                    placeholder="Add a reminder (e.g., Call Alice at 4:00 PM)",
-                    visible=False,
-                )
-                add_reminder_btn = gr.Button("Add Reminder", visible=False)
-                reminders_html = gr.HTML(
-                    "<div class='reminders-scroll'>No reminders yet.</div>",
-                    elem_id="rem_list",
-                    visible=False,
-                )
-
-                help_html = gr.HTML(
-                    """
+_HELP_HTML = """
                     <div class="help-container" style="padding: 1rem; line-height: 1.6; font-size: 15px;">
                         <h3 style="margin-bottom: 10px;">How to Use the Productivity Agent</h3>
 
@@ -1220,7 +1776,110 @@ button.sidebar-btn {
                             <li>Use the left navigation menu to switch between features.</li>
                         </ul>
                     </div>
-                    """,
+                    """
+
+# Shown when Generate is pressed with no text and no upload
+_ERROR_NO_TASKS_HTML = """
+<div class='output-scroll-wrapper'>
+  <div class='card schedule-card'>
+    <div class='card-body'>
+      <div class='d-flex align-items-center gap-2 mb-2'>
+        <span class='fs-5'>⚠️</span>
+        <h5 class='card-title mb-0'>No tasks provided</h5>
+      </div>
+      <p class='mb-0 text-danger small'>
+        Please enter tasks in the text box or upload a JSON/TXT file before generating a schedule.
+      </p>
+    </div>
+  </div>
+</div>
+"""
+
+_ERROR_CARD_HTML = """
+<div class='output-scroll-wrapper'>
+  <div class='card schedule-card'>
+    <div class='card-body'>
+      <div class='d-flex align-items-center gap-2 mb-2'>
+        <span class='fs-5'>❌</span>
+        <h5 class='card-title mb-0'>Error</h5>
+      </div>
+      <p class='mb-0 text-danger small'>{message}</p>
+    </div>
+  </div>
+</div>
+"""
+
+
+# Shared updates reused across set_page results; never mutated (Gradio
+# only pops "value", which these do not carry)
+_HIDE = gr.update(visible=False)
+_SHOW = gr.update(visible=True)
+_NAV_ACTIVE = gr.update(elem_classes="sidebar-btn sidebar-btn-active")
+_NAV_INACTIVE = gr.update(elem_classes="sidebar-btn")
+
+
+def build_ui():
+    with gr.Blocks(css=_CSS, title="Personal Productivity Agent", theme=gr.themes.Soft()) as demo:
+        with gr.Column(elem_classes="main-container"):
+            # ---------- SIDEBAR ----------
+            with gr.Column(scale=0, elem_classes="sidebar"):
+                gr.HTML(_SIDEBAR_HEADER_HTML)
+
+                # Navigation buttons (classes toggled in Python)
+                btn_new = gr.Button(" New Schedule", elem_classes="sidebar-btn sidebar-btn-active")
+                btn_history = gr.Button(" History", elem_classes="sidebar-btn")
+                btn_reminders = gr.Button(" Reminders", elem_classes="sidebar-btn")
+                btn_help = gr.Button(" Help & Guide", elem_classes="sidebar-btn")
+
+                gr.HTML(_PRIORITY_LEGEND_HTML)
+                gr.HTML(_SIDEBAR_FOOTER_HTML)
+
+            # ---------- MAIN AREA ----------
+            with gr.Column(scale=4, elem_classes="content-area"):
+                gr.HTML(_CONTENT_HEADER_HTML)
+
+                notification_area = gr.HTML(_EMPTY_TOAST_HTML, elem_id="notification_area")
+
+                # New Schedule output
+                new_output_html = gr.HTML(
+                    _EMPTY_STATE_HTML,
+                    elem_id="new_output",
+                )
+
+                # History section (hidden by default)
+                history_label = gr.Markdown("**Saved Schedules**", visible=False)
+                history_dropdown = gr.Dropdown(
+                    choices=[],
+                    label="",
+                    show_label=False,
+                    elem_id="history_dropdown",
+                    visible=False,
+                    interactive=True,
+                    allow_custom_value=True,
+                    type="value",
+                )
+
+                history_preview = gr.HTML(
+                    _HISTORY_PLACEHOLDER_HTML,
+                    elem_id="history_preview",
+                    visible=False,
+                )
+
+                # Reminders section (hidden by default)
+                reminder_input = gr.Textbox(
+                    show_label=False,
+                    placeholder="Add a reminder (e.g., Call Alice at 4:00 PM)",
+                    visible=False,
+                )
+                add_reminder_btn = gr.Button("Add Reminder", visible=False)
+                reminders_html = gr.HTML(
+                    "<div class='reminders-scroll'>No reminders yet.</div>",
+                    elem_id="rem_list",
+                    visible=False,
+                )
+
+                help_html = gr.HTML(
+                    _HELP_HTML,
                     visible=False,
                 )
      # Input area (only visible on New Schedule)
@@ -1254,75 +1913,54 @@ button.sidebar-btn {
         chat_state = gr.State([])
 
         # ---------- PAGE SWITCHING + ACTIVE NAV ----------
-        def set_page(page: str):
-            """Return updates for: main panels + which nav button is active."""
-            idx = _load_history_index()
-            choices = []
-            for e in idx:
-                try:
-                    created_at = e.get("created_at")
-                    label = _format_date_display(created_at)
-                except Exception:
-                    label = e.get("id", "Schedule")
-                choices.append((label, e.get("id")))
-
-            active = "sidebar-btn sidebar-btn-active"
-            inactive = "sidebar-btn"
+        # "new" and "help" carry no dynamic data, so their updates are built once
+        new_page_panels = (
+            _SHOW,  # new_output_html
+            _HIDE,  # history_label
+            _HIDE,  # history_dropdown
+            _HIDE,  # history_preview
+            _HIDE,  # reminder_input
+            _HIDE,  # add_reminder_btn
+            _HIDE,  # reminders_html
+            _HIDE,  # help_html
+            _SHOW,  # input_area
+        )
+        new_page_nav = (
+            _NAV_ACTIVE,
+            _NAV_INACTIVE,
+            _NAV_INACTIVE,
+            _NAV_INACTIVE,
+        )
+        help_page_panels = (
+            _HIDE,
+            _HIDE,
+            _HIDE,
+            _HIDE,
+            _HIDE,
+            _HIDE,
+            _HIDE,
+            _SHOW,
+            _HIDE,
+        )
+        help_page_nav = (
+            _NAV_INACTIVE,
+            _NAV_INACTIVE,
+            _NAV_INACTIVE,
+            _NAV_ACTIVE,
+        )
 
+        async def set_page(page: str):
+            """Return updates for: main panels + which nav button is active."""
             if page == "new":
-                return (
-                    # panels
-                    gr.update(visible=True),   # new_output_html
-                    gr.update(visible=False),  # history_label
-                    gr.update(visible=False),  # history_dropdown
-                    gr.update(visible=False),  # history_preview
-                    gr.update(visible=False),  # reminder_input
-                    gr.update(visible=False),  # add_reminder_btn
-                    gr.update(visible=False),  # reminders_html
-                    gr.update(visible=False),  # help_html
-                    gr.update(visible=True),   # input_area
-                    [],             # chat_state
-                    # nav buttons
-                    gr.update(elem_classes=active),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
-                )
+                # fresh chat_state list per call; the rest is shared
+                return new_page_panels + ([],) + new_page_nav
 
             if page == "history":
-                idx = _load_history_index()
-
-                choices = []
-                today_id = None
-                today_str = datetime.utcnow().strftime("%Y-%m-%d")
-
-                for e in idx:
-                    created_at = e.get("created_at")
-                    try:
-                        label = _format_date_display(created_at)
-                        date_only = created_at[:10] if created_at else ""
-                    except Exception:
-                        label = e.get("id", "Schedule")
-                        date_only = ""
-
-                    schedule_id = e.get("id")
-                    choices.append((label, schedule_id))
-
-                    # detect today's schedule
-                    if date_only == today_str and today_id is None:
-                        today_id = schedule_id
-
-                # fallback to latest if no today schedule
-                default_id = today_id or (choices[0][1] if choices else None)
-
-                preview_html = (
-                    _read_history_file(default_id)
-                    if default_id
-                    else "<div style='padding:24px;'>No history available.</div>"
-                )
+                # index stat/reload and the preview read stay off the event loop
+                choices, default_id, preview_html = await _in_thread(_history_page_data)
 
                 return (
-                    gr.update(visible=False),
+                    _HIDE,
                     gr.update(visible=True, value="**Saved Schedules**"),
                     gr.update(
                         visible=True,
@@ -1330,88 +1968,67 @@ button.sidebar-btn {
                         value=("Select a schedule" if not default_id else default_id),
                     ),
                     gr.update(visible=True, value=preview_html),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
+                    _HIDE,
+                    _HIDE,
+                    _HIDE,
+                    _HIDE,
+                    _HIDE,
                     gr.State([]),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=active),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
+                    _NAV_INACTIVE,
+                    _NAV_ACTIVE,
+                    _NAV_INACTIVE,
+                    _NAV_INACTIVE,
                 )
 
             if page == "reminders":
-                rems = _load_all_reminders()
+                rems = await _in_thread(_load_all_reminders)
                 if rems:
-                    from collections import defaultdict
-                    grouped: Dict[tuple, List[dict]] = defaultdict(list)
-                    for r in rems:
-                        st = r.get("scheduled_time", "")
-                        dt_local = _parse_iso_to_local(st)
-                        if dt_local:
-                            date_key = dt_local.strftime("%Y-%m-%d")
-                            date_display = dt_local.strftime("%A, %B %d, %Y")
-                        else:
-                            date_key = "unknown"
-                            date_display = "Unknown Date"
-                        grouped[(date_key, date_display)].append(r)
-                    sorted_dates = sorted(grouped.keys(), key=lambda x: x[0])
-                    html = "<div class='reminders-scroll'>"
-                    for date_key, date_display in sorted_dates:
-                        html += "<div class='reminder-date-group mb-3'>"
-                        html += f"<div class='reminder-date-header'>📅 {date_display}</div>"
-                        for r in grouped[(date_key, date_display)]:
+                    # Stable sort on the (cached) local day keeps file order within a day
+                    def day_of(r):
+                        return _reminder_date_group(r.get("scheduled_time", ""))
+
+                    parts = ["<div class='reminders-scroll'>"]
+                    for (_, date_display), group in itertools.groupby(
+                        sorted(rems, key=day_of), key=day_of
+                    ):
+                        parts.append("<div class='reminder-date-group mb-3'>")
+                        parts.append(f"<div class='reminder-date-header'>📅 {date_display}</div>")
+                        for r in group:
                             time_display = _format_time_from_iso(r.get('scheduled_time', ''))
-                            html += f"""
+                            parts.append(f"""
                             <div class='reminder-item'>
-                                <div class='reminder-message'>🔔 {r.get('message', '-')}</div>
-                                <div class='reminder-time'>{time_display}</div>
+                                <div class='reminder-message'>🔔 {_escape(str(r.get('message', '-')))}</div>
+                                <div class='reminder-time'>{_escape(time_display)}</div>
                             </div>
-                            """
-                        html += "</div>"
-                    html += "</div>"
+                            """)
+                        parts.append("</div>")
+                    parts.append("</div>")
+                    html = "".join(parts)
                 else:
                     html = "<div class='reminders-scroll text-secondary'>No reminders yet.</div>"
 
                 return (
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=True),
-                    gr.update(visible=True),
+                    _HIDE,
+                    _HIDE,
+                    _HIDE,
+                    _HIDE,
+                    _SHOW,
+                    _SHOW,
                     gr.update(visible=True, value=html),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
+                    _HIDE,
+                    _HIDE,
                     gr.State([]),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=active),
-                    gr.update(elem_classes=inactive),
+                    _NAV_INACTIVE,
+                    _NAV_INACTIVE,
+                    _NAV_ACTIVE,
+                    _NAV_INACTIVE,
                 )
 
             if page == "help":
-                return (
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=False),
-                    gr.update(visible=True),
-                    gr.update(visible=False),
-                    gr.State([]),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=inactive),
-                    gr.update(elem_classes=active),
-                )
+                return help_page_panels + ([],) + help_page_nav
 
             # default: new
-            return set_page("new")
+            return await set_page("new")
 
         # nav button clicks
         outputs_list = [
@@ -1431,160 +2048,101 @@ button.sidebar-btn {
             btn_help,
         ]
 
-        btn_new.click(fn=lambda: set_page("new"), inputs=None, outputs=outputs_list)
-        btn_history.click(fn=lambda: set_page("history"), inputs=None, outputs=outputs_list)
-        btn_reminders.click(fn=lambda: set_page("reminders"), inputs=None, outputs=outputs_list)
-        btn_help.click(fn=lambda: set_page("help"), inputs=None, outputs=outputs_list)
+        # async handlers run on Gradio's event loop instead of its worker
+        # threads; any disk I/O inside them goes through _in_thread
+        async def _nav_new():
+            return await set_page("new")
+
+        async def _nav_history():
+            return await set_page("history")
+
+        async def _nav_reminders():
+            return await set_page("reminders")
+
+        async def _nav_help():
+            return await set_page("help")
+
+        btn_new.click(fn=_nav_new, inputs=None, outputs=outputs_list)
+        btn_history.click(fn=_nav_history, inputs=None, outputs=outputs_list)
+        btn_reminders.click(fn=_nav_reminders, inputs=None, outputs=outputs_list)
+        btn_help.click(fn=_nav_help, inputs=None, outputs=outputs_list)
 
         # ---------- GENERATE SCHEDULE ----------
         def _generate_and_save(text_input_value, uploaded_file_value, chat_state_val):
-            file_text, _ = _read_uploaded_file(uploaded_file_value)
-            raw_text = (
-                file_text.strip()
-                if file_text and str(file_text).strip()
-                else (text_input_value or "").strip()
-            )
+            # An uploaded file takes precedence; the textbox is the fallback
+            raw_text = ""
+            if uploaded_file_value:
+                file_text, _ = _read_uploaded_file(uploaded_file_value)
+                raw_text = str(file_text or "").strip()
+            if not raw_text:
+                raw_text = (text_input_value or "").strip()
 
             if not raw_text:
-                error_html = """
-<div class='output-scroll-wrapper'>
-  <div class='card schedule-card'>
-    <div class='card-body'>
-      <div class='d-flex align-items-center gap-2 mb-2'>
-        <span class='fs-5'>⚠️</span>
-        <h5 class='card-title mb-0'>No tasks provided</h5>
-      </div>
-      <p class='mb-0 text-danger small'>
-        Please enter tasks in the text box or upload a JSON/TXT file before generating a schedule.
-      </p>
-    </div>
-  </div>
-</div>
-"""
-                return (
+                yield (
                     chat_state_val,
-                    gr.update(value=error_html),
+                    gr.update(value=_ERROR_NO_TASKS_HTML),
                     gr.update(),
-                    gr.update(value=error_html),
+                    gr.update(value=_ERROR_NO_TASKS_HTML),
                 )
+                return
 
             try:
-                result = run_orchestrator_on_input(raw_text)
-
-                # Local timestamp for user-facing things
-                created_at_dt = datetime.now(LOCAL_TZ)
-                created_at_iso = created_at_dt.isoformat()
-
-                schedule_html = format_schedule_html(result, created_at_iso=created_at_iso)
-                wrapped = f"<div class='output-scroll-wrapper'>{schedule_html}</div>"
-
-                # Save history entry
-                title = (raw_text[:80] + "...") if len(raw_text) > 80 else raw_text
-                _save_history_entry(
-                    wrapped,
-                    meta={
-                        "title": title,
-                        "created_at": created_at_iso,
-                        "source": "schedule",
-                    },
-                )
+                # Identical input already rendered and persisted: reuse it as is
+                wrapped = _cached_schedule_html(raw_text)
+                if wrapped is None:
+                    result = run_orchestrator_on_input(raw_text)
+
+                    # Local timestamp for user-facing things
+                    created_at_dt = datetime.now(LOCAL_TZ)
+                    created_at_iso = created_at_dt.isoformat()
+
+                    # Stream the schedule into the output as it renders
+                    chunks: List[str] = []
+                    for chunk in stream_schedule_html(result, created_at_iso=created_at_iso):
+                        chunks.append(chunk)
+                        yield (
+                            chat_state_val,
+                            gr.update(value=f"<div class='output-scroll-wrapper'>{''.join(chunks)}</div>"),
+                            gr.update(),
+                            gr.update(),
+                        )
+                    schedule_html = "".join(chunks)
+                    wrapped = f"<div class='output-scroll-wrapper'>{schedule_html}</div>"
+
+                    # Save history entry
+                    title = (raw_text[:80] + "...") if len(raw_text) > 80 else raw_text
+                    _save_history_entry(
+                        wrapped,
+                        meta={
+                            "title": title,
+                            "created_at": created_at_iso,
+                            "source": "schedule",
+                        },
+                    )
+
+                    # Build reminders from scheduled tasks
+                    _save_new_reminders(_reminders_for_schedule(result))
 
-                # Build reminders from scheduled tasks
-                outputs = result.get("outputs", {}) or {}
-                planned = outputs.get("planned", {}) or {}
-                scheduled = planned.get("scheduled_tasks", []) or []
-                reminders_to_save: List[dict] = []
-
-                for item in scheduled:
-                    if item.get("type") == "task":
-                        start_iso = item.get("start_time")
-                        if start_iso:
-                            reminders_to_save.append(
-                                {
-                                    "id": f"task_start_{item.get('name')}_{start_iso}",
-                                    "scheduled_time": start_iso,
-                                    "message": f"Start: {item.get('name')}",
-                                }
-                            )
-                            raw_pr = (item.get("priority") or "").strip().lower()
-                            is_high = raw_pr.startswith("high")
-                            if is_high:
-                                try:
-                                    dt_local = _parse_iso_to_local(start_iso)
-                                    if dt_local:
-                                        early_local = (dt_local - timedelta(minutes=10)).astimezone(
-                                            timezone.utc
-                                        ).isoformat()
-                                        reminders_to_save.append(
-                                            {
-                                                "id": f"task_high_alert_{item.get('name')}_{early_local}",
-                                                "scheduled_time": early_local,
-                                                "message": f"Upcoming (high-priority): {item.get('name')}",
-                                            }
-                                        )
-                                except Exception:
-                                    pass
-                        due = item.get("due_date")
-                        if due:
-                            try:
-                                dt_due_local = _parse_iso_to_local(due)
-                                if dt_due_local:
-                                    deadline_utc = (dt_due_local - timedelta(minutes=30)).astimezone(
-                                        timezone.utc
-                                    ).isoformat()
-                                    reminders_to_save.append(
-                                        {
-                                            "id": f"task_due_{item.get('name')}_{deadline_utc}",
-                                            "scheduled_time": deadline_utc,
-                                            "message": f"Deadline soon: {item.get('name')}",
-                                        }
-                                    )
-                            except Exception:
-                                pass
-
-                if reminders_to_save:
-                    _write_reminders_file(reminders_to_save)
+                    _store_schedule_html(raw_text, wrapped)
 
                 # Refresh history dropdown
-                idx = _load_history_index()
-                choices = []
-                default_id = None
-                for i, e in enumerate(idx):
-                    try:
-                        label = _format_date_display(e.get("created_at"))
-                    except Exception:
-                        label = e.get("id")
-                    schedule_id = e.get("id")
-                    choices.append((label, schedule_id))
-                    if i == 0:
-                        default_id = schedule_id
+                choices = _history_choices()
+                default_id = choices[0][1] if choices else None
 
                 # Update chat state (optional preview)
                 new_state = list(chat_state_val or [])
                 preview_text = raw_text[:100] + ("..." if len(raw_text) > 100 else "")
                 new_state.append(["Tasks submitted", preview_text])
 
-                return (
+                yield (
                     new_state,
                     gr.update(value=wrapped),
                     gr.update(choices=choices, value=default_id),
                     gr.update(value=wrapped),
                 )
             except Exception as e:
-                err_html = f"""
-<div class='output-scroll-wrapper'>
-  <div class='card schedule-card'>
-    <div class='card-body'>
-      <div class='d-flex align-items-center gap-2 mb-2'>
-        <span class='fs-5'>❌</span>
-        <h5 class='card-title mb-0'>Error</h5>
-      </div>
-      <p class='mb-0 text-danger small'>{str(e)}</p>
-    </div>
-  </div>
-</div>
-"""
-                return (
+                err_html = _ERROR_CARD_HTML.format(message=_escape(str(e)))
+                yield (
                     chat_state_val,
                     gr.update(value=err_html),
                     gr.update(),
@@ -1598,10 +2156,10 @@ button.sidebar-btn {
         )
 
         # ---------- HISTORY PREVIEW ----------
-        def preview_history_file(selected):
+        async def preview_history_file(selected):
             if not selected:
                 return "<div style='padding:24px;'>No schedule selected.</div>"
-            return _read_history_file(selected)
+            return await _in_thread(_read_history_file, selected)
 
         history_dropdown.change(
             fn=preview_history_file,
@@ -1610,56 +2168,32 @@ button.sidebar-btn {
         )
 
         # ---------- REMINDERS MANUAL ADD ----------
-        def add_reminder(text):
+        def _reminder_list_html(rems: List[dict]) -> str:
+            parts = ["<div class='reminders-scroll'>"]
+            parts.extend(
+                f"<div>{_escape(str(r.get('message')))} <small class='text-secondary'>({_escape(_format_date_display(r.get('scheduled_time') or ''))})</small></div>"
+                for r in rems
+            )
+            parts.append("</div>")
+            return "".join(parts)
+
+        async def add_reminder(text):
             if not text or not text.strip():
-                rems = _load_all_reminders()
+                rems = await _in_thread(_load_all_reminders)
                 if rems:
-                    html = "<div class='reminders-scroll'>" + "".join(
-                        f"<div>{r.get('message')} <small class='text-secondary'>({_format_date_display(r.get('scheduled_time') or '')})</small></div>"
-                        for r in rems
-                    ) + "</div>"
+                    html = _reminder_list_html(rems)
                 else:
                     html = "<div class='reminders-scroll text-secondary'>No reminders yet.</div>"
                 return gr.update(value=""), gr.update(value=html)
 
-            parsed_time = None
-            msg = text.strip()
-            try:
-                lowered = text.lower()
-                if " at " in lowered:
-                    parts = text.rsplit(" at ", 1)
-                    msg_text = parts[0].strip() if parts[0].strip() else "Reminder"
-                    time_part = parts[1].strip()
-                    try:
-                        dt_try = datetime.strptime(time_part, "%I:%M %p")
-                        today = datetime.utcnow().date()
-                        combined = datetime.combine(today, dt_try.time())
-                        parsed_time = combined.replace(tzinfo=timezone.utc).isoformat()
-                        msg = msg_text if msg_text else msg
-                    except Exception:
-                        try:
-                            dt_try = datetime.fromisoformat(time_part)
-                            if dt_try.tzinfo is None:
-                                dt_try = dt_try.replace(tzinfo=timezone.utc)
-                            parsed_time = dt_try.astimezone(timezone.utc).isoformat()
-                        except Exception:
-                            parsed_time = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
-                else:
-                    parsed_time = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
-            except Exception:
-                parsed_time = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
-
+            msg, parsed_time = _parse_manual_reminder(text)
             rem = {
                 "id": f"manual_{int(time.time())}",
                 "scheduled_time": parsed_time,
                 "message": msg,
             }
-            _write_reminders_file([rem])
-            rems = _load_all_reminders()
-            html = "<div class='reminders-scroll'>" + "".join(
-                f"<div>{r.get('message')} <small class='text-secondary'>({_format_date_display(r.get('scheduled_time') or '')})</small></div>"
-                for r in rems
-            ) + "</div>"
+            await _in_thread(_write_reminders_file, [rem])
+            html = _reminder_list_html(await _in_thread(_load_all_reminders))
             return gr.update(value=""), gr.update(value=html)
 
         add_reminder_btn.click(
@@ -1668,40 +2202,99 @@ button.sidebar-btn {
             outputs=[reminder_input, reminders_html],
         )
 
-        # ---------- REMINDER POLLING ----------
-        def poll_notifications():
-            with NOTIFICATION_LOCK:
-                items = NOTIFICATION_BUFFER.copy()
-                NOTIFICATION_BUFFER.clear()
-            if not items:
-                return "<div class='toast-wrap' id='toast_wrap'></div>"
-            toasts_html = "<div class='toast-wrap' id='toast_wrap'>"
+        # ---------- REMINDER NOTIFICATIONS ----------
+        def _toasts_html(items: List[dict]) -> str:
+            parts = ["<div class='toast-wrap' id='toast_wrap'>"]
             for it in items:
                 try:
                     st = it.get("scheduled_time", "")
                     disp_time = _format_time_from_iso(st) or st
-                    toasts_html += f"""
+                    parts.append(f"""
                     <div class="toast">
                         <div class="icon fs-4">🔔</div>
                         <div class="txt">
-                            <div class="title">{it.get('message')}</div>
-                            <div class="time">{disp_time}</div>
+                            <div class="title">{_escape(str(it.get('message')))}</div>
+                            <div class="time">{_escape(disp_time)}</div>
                         </div>
                     </div>
-                    """
+                    """)
                 except Exception:
                     continue
-            toasts_html += "</div>"
-            return toasts_html
+            parts.append("</div>")
+            return "".join(parts)
 
-        try:
-            demo.load(fn=poll_notifications, inputs=None, outputs=[notification_area], every=3)
-        except TypeError:
-            demo.load(fn=poll_notifications, inputs=None, outputs=[notification_area])
+        async def notification_stream(request: gr.Request):
+            """Server-push toasts: idles until a reminder fires."""
+            sub = _NotifySubscriber(
+                getattr(request, "session_hash", None), asyncio.get_running_loop()
+            )
+            with NOTIFICATION_LOCK:
+                pending = NOTIFICATION_BUFFER.copy()
+                NOTIFICATION_BUFFER.clear()
+                _NOTIFY_SUBSCRIBERS.add(sub)
+            try:
+                showing = bool(pending)
+                yield _toasts_html(pending) if pending else _EMPTY_TOAST_HTML
+                while True:
+                    try:
+                        await asyncio.wait_for(
+                            sub.wake.wait(), timeout=TOAST_SECONDS if showing else None
+                        )
+                    except asyncio.TimeoutError:
+                        showing = False
+                        yield _EMPTY_TOAST_HTML
+                        continue
+                    sub.wake.clear()
+                    with NOTIFICATION_LOCK:
+                        if sub not in _NOTIFY_SUBSCRIBERS:
+                            return  # tab closed
+                        items = sub.pending[:]
+                        sub.pending.clear()
+                    if items:
+                        showing = True
+                        yield _toasts_html(items)
+            finally:
+                with NOTIFICATION_LOCK:
+                    _NOTIFY_SUBSCRIBERS.discard(sub)
+                    # Never shown in this tab and no other tab got them
+                    if not _NOTIFY_SUBSCRIBERS:
+                        NOTIFICATION_BUFFER.extend(sub.pending)
+                    sub.pending.clear()
+
+        def drop_notification_stream(request: gr.Request):
+            _unsubscribe_notifications(getattr(request, "session_hash", None))
+
+        async def poll_notifications():
+            # Fallback for Gradio versions without the unload hook.
+            # Lock-free fast path; an item racing in is picked up next tick
+            if not NOTIFICATION_BUFFER:
+                return _EMPTY_TOAST_HTML
+            with NOTIFICATION_LOCK:
+                items = NOTIFICATION_BUFFER.copy()
+                NOTIFICATION_BUFFER.clear()
+            return _toasts_html(items) if items else _EMPTY_TOAST_HTML
+
+        if hasattr(demo, "unload"):
+            # one long-lived stream per tab; must not be serialized behind others
+            demo.load(
+                fn=notification_stream,
+                inputs=None,
+                outputs=[notification_area],
+                concurrency_limit=None,
+            )
+            # Gradio only marks a closed tab's stream inactive; unload wakes
+            # it so it unsubscribes and later reminders reach the buffer
+            demo.unload(drop_notification_stream)
+        else:
+            # Older Gradio: no unload hook to clean up streams, so poll instead
+            try:
+                demo.load(fn=poll_notifications, inputs=None, outputs=[notification_area], every=3)
+            except TypeError:
+                demo.load(fn=poll_notifications, inputs=None, outputs=[notification_area])
 
         # initial page = New Schedule with New highlighted
         demo.load(
-            fn=lambda: set_page("new"),
+            fn=_nav_new,
             inputs=None,
             outputs=[
                 new_output_html,